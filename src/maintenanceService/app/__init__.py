@@ -1,20 +1,39 @@
-from flask import Flask
+from flask import Flask, request
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_restx import Api
-from config import config
+from config import config, CONFIG_CLASS
+from app.utils.auth import init_auth
+from app.utils.cache import RedisCache
+from app.utils.json_provider import OrjsonProvider, output_json
+from app.utils.msgpack_output import MSGPACK_MIMETYPE, output_msgpack
 
 db = SQLAlchemy()
 migrate = Migrate()
+cache = RedisCache()
+compress = Compress()
 
-def create_app(config_name='default'):
+def create_app(config_name=None):
+    """Build the app with the named config, or the FLASK_ENV one (CONFIG_CLASS) by default"""
     app = Flask(__name__)
-    app.config.from_object(config[config_name])
+    app.json = OrjsonProvider(app)
+    app.config.from_object(config[config_name] if config_name else CONFIG_CLASS)
     
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
+    cache.init_app(app)
+    compress.init_app(app)
+    # Compressed responses carry suffixed ETags; match If-None-Match against the plain ones
+    from app.utils.responses import strip_compressed_etag_suffixes
+    app.before_request(strip_compressed_etag_suffixes)
+    init_auth(app)
+    
+    # Background jobs (Celery, using Redis as broker)
+    from app.tasks import celery_init_app
+    celery_init_app(app)
     
     # Configure CORS for all routes (including /health and /api/*)
     CORS(app, resources={
@@ -25,6 +44,13 @@ def create_app(config_name='default'):
         }
     })
     
+    # Answer CORS preflights before dispatch, so they never reach auth decorators or views
+    # (CORS headers are still added by Flask-CORS's after_request hook)
+    @app.before_request
+    def short_circuit_preflight():
+        if request.method == 'OPTIONS' and request.routing_exception is None:
+            return app.make_default_options_response()
+    
     # Initialize Flask-RESTX API with Swagger documentation
     api = Api(
         app,
@@ -44,6 +70,10 @@ def create_app(config_name='default'):
         contact='Fleet Management Team',
         contact_email='support@fleetmanagement.com',
     )
+    # Marshalled resource output is serialized with orjson as well
+    api.representation('application/json')(output_json)
+    # Internal consumers can ask for MessagePack with Accept: application/msgpack
+    api.representation(MSGPACK_MIMETYPE)(output_msgpack)
     
     # Register API namespaces (Flask-RESTX with Swagger)
     from app.routes.maintenance_api import api as maintenance_ns
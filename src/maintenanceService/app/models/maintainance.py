@@ -64,6 +64,25 @@ class MaintenanceItem(db.Model):
     parts_needed = db.Column(db.JSON)
     attachments = db.Column(db.JSON)
     
+    __table_args__ = (
+        # Keyset pagination order for the items list
+        db.Index('ix_maintenance_items_created_at_id', created_at.desc(), id.desc()),
+        # Items list filters, each followed by the list sort key
+        db.Index('ix_maintenance_items_vehicle_created', vehicle_id, created_at.desc(), id.desc()),
+        db.Index('ix_maintenance_items_status_created', status, created_at.desc(), id.desc()),
+        db.Index('ix_maintenance_items_assigned_created', assigned_to, created_at.desc(), id.desc()),
+        db.Index(
+            'ix_maintenance_items_open_priority',
+            priority, created_at.desc(), id.desc(),
+            postgresql_where=status.in_([
+                MaintenanceStatus.OVERDUE,
+                MaintenanceStatus.DUE_SOON,
+                MaintenanceStatus.SCHEDULED,
+                MaintenanceStatus.IN_PROGRESS
+            ])
+        ),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -1 +0,0 @@
-from app.routes.maintainance_route import maintenance_bp
@@ -3,28 +3,53 @@ Flask-RESTX API Routes with Swagger Documentation
 Provides OpenAPI/Swagger UI for the Maintenance Service
 """
 
-from flask import request
-from flask_restx import Namespace, Resource, fields
-from app.utils.auth import require_auth
-from app.services.maintainance_service import MaintenanceService
+from flask import request, current_app
+from flask_restx import Namespace, Resource, fields, marshal
+from app import cache, db
+from app.utils.api_models import EnumValue
+from app.utils.auth import auth, require_auth
+from app.utils.cache import (
+    SUMMARY_KEY, OVERDUE_KEY, UPCOMING_KEY, COST_ANALYTICS_KEY, STATUS_BULK_LOCK_KEY,
+    TRENDS_KEY, history_key, item_key, item_etag_key
+)
+from app.utils.filters import parse_maintenance_filters
+from app.utils.json_provider import dumps_bytes
+from app.utils.pagination import decode_cursor, is_cached_page, page_args, per_page_arg
+from app.utils.responses import (
+    cached_json_response, json_response, ndjson_response, not_modified, raw_response,
+    version_etag, wants_ndjson
+)
+from app.services.maintainance_service import (
+    MaintenanceService, MAX_TREND_PERIODS, MAX_UPCOMING_DAYS, TREND_PERIODS
+)
+from app.tasks import run_status_bulk
 from app.schemas.maintainance_schema import (
     MaintenanceItemCreateSchema,
     MaintenanceItemUpdateSchema,
-    TechnicianSchema,
     TechnicianCreateSchema,
     TechnicianUpdateSchema,
-    PartSchema,
     PartCreateSchema,
     PartUpdateSchema,
-    RecurringScheduleSchema,
     RecurringScheduleCreateSchema,
     RecurringScheduleUpdateSchema
 )
 from marshmallow import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
 
 # Create API namespace
 api = Namespace('maintenance', description='Maintenance management operations')
 
+# Marshmallow schemas are stateless for load(), so build them once instead of per request
+maintenance_create_schema = MaintenanceItemCreateSchema()
+maintenance_update_schema = MaintenanceItemUpdateSchema()
+technician_create_schema = TechnicianCreateSchema()
+technician_update_schema = TechnicianUpdateSchema()
+part_create_schema = PartCreateSchema()
+part_update_schema = PartUpdateSchema()
+recurring_schedule_create_schema = RecurringScheduleCreateSchema()
+recurring_schedule_update_schema = RecurringScheduleUpdateSchema()
+
 # ==================== Swagger Models ====================
 
 # Maintenance Item Model (for responses)
@@ -33,10 +58,10 @@ maintenance_item_model = api.model('MaintenanceItem', {
     'vehicle_id': fields.String(required=True, description='Vehicle ID', example='VH-001'),
     'type': fields.String(required=True, description='Maintenance type', example='Oil Change'),
     'description': fields.String(description='Detailed description', example='Regular oil and filter change'),
-    'status': fields.String(required=True, description='Current status', 
+    'status': EnumValue(required=True, description='Current status',
                            enum=['overdue', 'due_soon', 'scheduled', 'in_progress', 'completed', 'cancelled'],
                            example='scheduled'),
-    'priority': fields.String(required=True, description='Priority level',
+    'priority': EnumValue(required=True, description='Priority level',
                              enum=['low', 'medium', 'high', 'critical'],
                              example='medium'),
     'due_date': fields.Date(required=True, description='Due date', example='2024-12-31'),
@@ -50,7 +75,7 @@ maintenance_item_model = api.model('MaintenanceItem', {
     'assigned_technician': fields.String(description='Assigned technician name'),
     'notes': fields.String(description='Additional notes'),
     'parts_needed': fields.Raw(description='JSON list of required parts'),
-    'attachments': fields.Raw(description='JSON list of attachment URLs'),
+    'attachments': fields.List(fields.Raw, description='JSON list of attachment objects'),
     'created_at': fields.DateTime(description='Creation timestamp'),
     'updated_at': fields.DateTime(description='Last update timestamp'),
 })
@@ -101,6 +126,14 @@ pagination_model = api.model('PaginatedMaintenanceItems', {
     'pages': fields.Integer(description='Total number of pages'),
 })
 
+# Cursor Pagination Model (main items list)
+cursor_pagination_model = api.model('CursorPaginatedMaintenanceItems', {
+    'items': fields.List(fields.Nested(maintenance_item_model), description='List of maintenance items'),
+    'per_page': fields.Integer(description='Items per page'),
+    'next_cursor': fields.String(description='Cursor for the next page (null on the last page)'),
+    'total_estimate': fields.Integer(description='Approximate number of matching items (null if unknown)'),
+})
+
 # Summary Model
 summary_model = api.model('MaintenanceSummary', {
     'total_items': fields.Integer(description='Total maintenance items'),
@@ -112,6 +145,14 @@ summary_model = api.model('MaintenanceSummary', {
     'due_soon_count': fields.Integer(description='Number of items due soon'),
 })
 
+# Bulk Status Job Model
+bulk_job_model = api.model('BulkStatusJob', {
+    'job_id': fields.String(description='Background job ID'),
+    'state': fields.String(description='Job state (PENDING, STARTED, SUCCESS, FAILURE)'),
+    'updated_count': fields.Integer(description='Number of items updated (once finished)'),
+    'error': fields.String(description='Failure reason (if the job failed)'),
+})
+
 # Error Model
 error_model = api.model('Error', {
     'error': fields.String(description='Error message'),
@@ -125,15 +166,15 @@ technician_model = api.model('Technician', {
     'email': fields.String(description='Email Address'),
     'phone': fields.String(description='Phone Number'),
     'specialization': fields.List(fields.String, description='List of specializations'),
-    'status': fields.String(description='Status'),
+    'status': EnumValue(description='Status'),
     'rating': fields.Float(description='Rating'),
     'completed_jobs': fields.Integer(description='Completed Jobs Count'),
     'active_jobs': fields.Integer(description='Active Jobs Count'),
     'certifications': fields.List(fields.String, description='Certifications'),
     'hourly_rate': fields.Float(description='Hourly Rate'),
     'join_date': fields.String(description='Join Date'),
-    'created_at': fields.String(description='Created At'),
-    'updated_at': fields.String(description='Updated At'),
+    'created_at': fields.DateTime(description='Created At'),
+    'updated_at': fields.DateTime(description='Updated At'),
 })
 
 technician_create_model = api.model('TechnicianCreate', {
@@ -206,14 +247,14 @@ recurring_schedule_model = api.model('RecurringSchedule', {
     'vehicle_id': fields.String(description='Vehicle ID'),
     'maintenance_type': fields.String(description='Maintenance Type'),
     'description': fields.String(description='Description'),
-    'frequency': fields.String(description='Frequency'),
+    'frequency': EnumValue(description='Frequency'),
     'frequency_value': fields.Integer(description='Frequency Value'),
     'estimated_cost': fields.Float(description='Estimated Cost'),
     'estimated_duration': fields.Float(description='Estimated Duration'),
     'assigned_to': fields.String(description='Assigned To'),
     'is_active': fields.Boolean(description='Is Active'),
-    'last_executed': fields.String(description='Last Executed'),
-    'next_scheduled': fields.String(description='Next Scheduled'),
+    'last_executed': fields.DateTime(description='Last Executed'),
+    'next_scheduled': fields.DateTime(description='Next Scheduled'),
     'total_executions': fields.Integer(description='Total Executions'),
     'created_date': fields.String(description='Created Date'),
 })
@@ -242,48 +283,127 @@ recurring_schedule_update_model = api.model('RecurringScheduleUpdate', {
     'is_active': fields.Boolean(),
 })
 
+# Paginated list models (same envelope as PaginatedMaintenanceItems)
+def paginated_model(name, model, description, skip_none=False):
+    return api.model(name, {
+        'items': fields.List(fields.Nested(model, skip_none=skip_none), description=description),
+        'total': fields.Integer(description='Total number of items'),
+        'page': fields.Integer(description='Current page number'),
+        'per_page': fields.Integer(description='Items per page'),
+        'pages': fields.Integer(description='Total number of pages'),
+    })
+
+# History / overdue / upcoming pages leave null item fields off the wire
+maintenance_item_page_model = paginated_model(
+    'MaintenanceItemPage', maintenance_item_model, 'List of maintenance items', skip_none=True
+)
+technician_page_model = paginated_model('PaginatedTechnicians', technician_model, 'List of technicians')
+part_page_model = paginated_model('PaginatedParts', part_model, 'List of parts')
+recurring_schedule_page_model = paginated_model(
+    'PaginatedRecurringSchedules', recurring_schedule_model, 'List of recurring schedules'
+)
+
+# ==================== Error Handling ====================
+
+@api.errorhandler(SQLAlchemyError)
+def handle_database_error(error):
+    """Roll back the failed transaction so the session is usable again, then answer 500"""
+    db.session.rollback()
+    return {'error': 'Database error'}, 500
+
+
+@api.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Single catch-all for the namespace: HTTP errors pass through, anything else becomes a 500
+    
+    Flask-RESTX logs every 5xx itself, and ERROR_INCLUDE_MESSAGE is off, so exception text
+    never reaches the client.
+    """
+    if isinstance(error, HTTPException):
+        # Keep headers such as Allow (405) or WWW-Authenticate (401); the body is ours
+        headers = {name: value for name, value in error.get_headers() if name != 'Content-Type'}
+        return getattr(error, 'data', None) or {'message': error.description}, error.code, headers
+    
+    return {'error': 'Internal server error'}, 500
+
+# ==================== Helpers ====================
+
+def _load_body(schema, **kwargs):
+    """Load the JSON request body with schema, or abort 400 with the field errors
+    
+    Not an errorhandler: Flask-RESTX answers with the exception's `data`, which on a
+    Marshmallow ValidationError is the submitted input rather than the errors.
+    """
+    try:
+        return schema.load(request.get_json(silent=True), **kwargs)
+    except ValidationError as e:
+        api.abort(400, 'Validation error', errors=e.messages)
+
+
+def _marshal_list_item(item):
+    """One item as it appears in MaintenanceItemPage lists (null fields left off)"""
+    return marshal(item, maintenance_item_model, skip_none=True)
+
+
+def _load_items_json(item_ids):
+    """Serialized items for item_ids, in order: one MGET, then one query for the misses"""
+    cached = cache.get_many([item_key(item_id) for item_id in item_ids])
+    missing = [item_id for item_id, raw in zip(item_ids, cached) if raw is None]
+    
+    fresh = {}
+    if missing:
+        to_cache = {}
+        for item in MaintenanceService.get_maintenance_items_by_ids(missing):
+            fresh[item.id] = dumps_bytes(marshal(item, maintenance_item_model))
+            to_cache[item_key(item.id)] = fresh[item.id]
+            to_cache[item_etag_key(item.id)] = version_etag(item.id, item.updated_at)
+        cache.set_many(to_cache, current_app.config['ITEM_CACHE_TTL'])
+    
+    # Items deleted since the ID query are dropped
+    items = (raw if raw is not None else fresh.get(item_id) for item_id, raw in zip(item_ids, cached))
+    return [raw for raw in items if raw is not None]
+
 # ==================== API Resources ====================
 
 @api.route('/')
 class MaintenanceList(Resource):
     @api.doc('list_maintenance_items',
              params={
-                 'page': 'Page number (default: 1)',
-                 'per_page': 'Items per page (default: 10)',
+                 'after': 'Cursor returned as next_cursor by the previous page',
+                 'per_page': 'Items per page (default: 10, max: 200)',
                  'vehicle': 'Filter by vehicle ID',
                  'status': 'Filter by status (can specify multiple)',
                  'priority': 'Filter by priority (can specify multiple)',
                  'assignedTo': 'Filter by assignment'
              })
-    @api.marshal_with(pagination_model, code=200, description='Success')
+    @api.response(200, 'Success', cursor_pagination_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
+    @api.response(400, 'Invalid cursor', error_model)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
     @require_auth
     def get(self):
-        """List all maintenance items with optional filtering and pagination"""
+        """List all maintenance items with optional filtering and cursor pagination"""
         try:
-            # Get query parameters
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 10, type=int)
-            
-            filters = {}
-            if request.args.get('vehicle'):
-                filters['vehicle'] = request.args.get('vehicle')
-            if request.args.get('status'):
-                filters['status'] = request.args.getlist('status')
-            if request.args.get('priority'):
-                filters['priority'] = request.args.getlist('priority')
-            if request.args.get('assignedTo'):
-                filters['assignedTo'] = request.args.get('assignedTo')
-            
-            result = MaintenanceService.get_all_maintenance_items(filters, page, per_page)
-            return result, 200
+            after = decode_cursor(request.args.get('after'))
+        except ValueError as e:
+            api.abort(400, str(e))
+        
+        # Get query parameters (each key is read once)
+        args = request.args
+        per_page = per_page_arg(args, default=10)
+        
+        filters = parse_maintenance_filters(args)
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        result = MaintenanceService.get_all_maintenance_items(filters, after, per_page)
+        items = _load_items_json(result.pop('item_ids'))
+        
+        # Splice the cached item documents in as-is rather than decoding and re-encoding them
+        payload = b'{"items":[' + b','.join(items) + b'],' + dumps_bytes(result)[1:]
+        return json_response(payload)
     
     @api.doc('create_maintenance_item')
-    @api.expect(maintenance_create_model, validate=True)
+    @api.expect(maintenance_create_model)
     @api.marshal_with(maintenance_item_model, code=201, description='Created')
     @api.response(400, 'Validation Error', error_model)
     @api.response(500, 'Internal Server Error', error_model)
@@ -291,42 +411,44 @@ class MaintenanceList(Resource):
     @require_auth
     def post(self):
         """Create a new maintenance item"""
-        try:
-            schema = MaintenanceItemCreateSchema()
-            data = schema.load(request.json)
-            
-            item = MaintenanceService.create_maintenance_item(data)
-            return item.to_dict(), 201
+        data = _load_body(maintenance_create_schema)
         
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        item = MaintenanceService.create_maintenance_item(data)
+        return item, 201
 
 
 @api.route('/<string:item_id>')
 @api.param('item_id', 'The maintenance item identifier')
 class MaintenanceItem(Resource):
     @api.doc('get_maintenance_item')
-    @api.marshal_with(maintenance_item_model, code=200, description='Success')
+    @api.response(200, 'Success', maintenance_item_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(404, 'Maintenance item not found', error_model)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
     @require_auth
     def get(self, item_id):
         """Get a specific maintenance item by ID"""
-        try:
-            item = MaintenanceService.get_maintenance_item(item_id)
-            if not item:
-                api.abort(404, f'Maintenance item {item_id} not found')
-            
-            return item.to_dict(), 200
+        key, etag_key = item_key(item_id), item_etag_key(item_id)
+        cached, etag = cache.get_many([key, etag_key])
+        if cached is not None and etag is not None:
+            return json_response(cached, etag=etag.decode())
+        
+        item = MaintenanceService.get_maintenance_item(item_id)
+        if not item:
+            api.abort(404, f'Maintenance item {item_id} not found')
+        
+        # The ETag tracks the row version, so a matching client skips serialization
+        etag = version_etag(item.id, item.updated_at)
+        if etag in request.if_none_match:
+            return not_modified(etag)
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        payload = dumps_bytes(marshal(item, maintenance_item_model))
+        cache.set_many({key: payload, etag_key: etag}, current_app.config['ITEM_CACHE_TTL'])
+        return json_response(payload, etag=etag)
     
     @api.doc('update_maintenance_item')
-    @api.expect(maintenance_update_model, validate=True)
+    @api.expect(maintenance_update_model)
     @api.marshal_with(maintenance_item_model, code=200, description='Success')
     @api.response(400, 'Validation Error', error_model)
     @api.response(404, 'Maintenance item not found', error_model)
@@ -335,23 +457,16 @@ class MaintenanceItem(Resource):
     @require_auth
     def put(self, item_id):
         """Update a maintenance item (full update)"""
-        try:
-            schema = MaintenanceItemUpdateSchema()
-            data = schema.load(request.json, partial=False)
-            
-            item = MaintenanceService.update_maintenance_item(item_id, data)
-            if not item:
-                api.abort(404, f'Maintenance item {item_id} not found')
-            
-            return item.to_dict(), 200
+        data = _load_body(maintenance_update_schema, partial=False)
+        
+        item = MaintenanceService.update_maintenance_item(item_id, data)
+        if not item:
+            api.abort(404, f'Maintenance item {item_id} not found')
         
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        return item, 200
     
     @api.doc('partial_update_maintenance_item')
-    @api.expect(maintenance_update_model, validate=True)
+    @api.expect(maintenance_update_model)
     @api.marshal_with(maintenance_item_model, code=200, description='Success')
     @api.response(400, 'Validation Error', error_model)
     @api.response(404, 'Maintenance item not found', error_model)
@@ -360,102 +475,140 @@ class MaintenanceItem(Resource):
     @require_auth
     def patch(self, item_id):
         """Partially update a maintenance item"""
-        try:
-            schema = MaintenanceItemUpdateSchema()
-            data = schema.load(request.json, partial=True)
-            
-            item = MaintenanceService.update_maintenance_item(item_id, data)
-            if not item:
-                api.abort(404, f'Maintenance item {item_id} not found')
-            
-            return item.to_dict(), 200
+        data = _load_body(maintenance_update_schema, partial=True)
         
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        item = MaintenanceService.update_maintenance_item(item_id, data)
+        if not item:
+            api.abort(404, f'Maintenance item {item_id} not found')
+        
+        return item, 200
     
     @api.doc('delete_maintenance_item')
     @api.response(200, 'Success')
     @api.response(404, 'Maintenance item not found', error_model)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
-    @require_auth
+    @api.response(403, 'Forbidden (fleet-admin role required)')
+    @auth(role='fleet-admin')
     def delete(self, item_id):
         """Delete a maintenance item"""
-        try:
-            success = MaintenanceService.delete_maintenance_item(item_id)
-            if not success:
-                api.abort(404, f'Maintenance item {item_id} not found')
-            
-            return {'message': 'Maintenance item deleted successfully'}, 200
+        success = MaintenanceService.delete_maintenance_item(item_id)
+        if not success:
+            api.abort(404, f'Maintenance item {item_id} not found')
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        return raw_response({'message': 'Maintenance item deleted successfully'})
 
 
 @api.route('/summary')
 class MaintenanceSummary(Resource):
     @api.doc('get_maintenance_summary')
-    @api.marshal_with(summary_model, code=200, description='Success')
+    @api.response(200, 'Success', summary_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
         """Get maintenance summary statistics"""
-        try:
-            summary = MaintenanceService.get_maintenance_summary()
-            return summary, 200
-        
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        # Serve the already-serialized payload straight from Redis when possible
+        return cached_json_response(
+            SUMMARY_KEY,
+            current_app.config['SUMMARY_CACHE_TTL'],
+            lambda: dumps_bytes(marshal(MaintenanceService.get_maintenance_summary(), summary_model)),
+            max_age=current_app.config['SUMMARY_HTTP_MAX_AGE']
+        )
 
 
 @api.route('/vehicle/<string:vehicle_id>/history')
 @api.param('vehicle_id', 'The vehicle identifier')
 class VehicleHistory(Resource):
-    @api.doc('get_vehicle_maintenance_history')
-    @api.marshal_list_with(maintenance_item_model, code=200, description='Success')
+    @api.doc('get_vehicle_maintenance_history',
+             params={
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
+             })
+    @api.response(200, 'Success', maintenance_item_page_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(500, 'Internal Server Error', error_model)
     def get(self, vehicle_id):
-        """Get maintenance history for a specific vehicle"""
-        try:
-            history = MaintenanceService.get_vehicle_maintenance_history(vehicle_id)
-            return history, 200
+        """Get a page of maintenance history for a specific vehicle (Accept: application/x-ndjson streams all of it)"""
+        if wants_ndjson():
+            return ndjson_response(
+                MaintenanceService.stream_vehicle_maintenance_history(vehicle_id),
+                _marshal_list_item
+            )
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        page, per_page = page_args(request.args)
+        return cached_json_response(
+            history_key(vehicle_id),
+            current_app.config['HISTORY_CACHE_TTL'],
+            lambda: dumps_bytes(marshal(
+                MaintenanceService.get_vehicle_maintenance_history(vehicle_id, page, per_page),
+                maintenance_item_page_model
+            )),
+            field=f'{page}:{per_page}',
+            cacheable=is_cached_page(page, per_page)
+        )
 
 
 @api.route('/status/update-bulk')
 class BulkStatusUpdate(Resource):
     @api.doc('update_statuses_bulk')
-    @api.response(200, 'Success')
+    @api.response(202, 'Job accepted', bulk_job_model)
+    @api.response(409, 'A bulk status update is already running', error_model)
     @api.response(500, 'Internal Server Error', error_model)
+    @api.response(401, 'Unauthorized')
+    @api.response(403, 'Forbidden (fleet-admin role required)')
+    @auth(role='fleet-admin')
     def post(self):
-        """Background job endpoint to update maintenance statuses based on due dates"""
+        """Queue the background job that updates maintenance statuses based on due dates"""
+        # Only one sweep at a time; the job releases the lock when it finishes
+        lock_token = cache.acquire_lock(STATUS_BULK_LOCK_KEY, current_app.config['STATUS_BULK_LOCK_TTL'])
+        if lock_token is None:
+            api.abort(409, 'Bulk status update already running')
+        
         try:
-            updated = MaintenanceService.update_maintenance_status_bulk()
-            return {
-                'message': f'Updated {updated} maintenance items',
-                'updated_count': updated
-            }, 200
+            task = run_status_bulk.delay(lock_token)
+        except Exception:
+            cache.release_lock(STATUS_BULK_LOCK_KEY, lock_token)
+            raise
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        return raw_response({
+            'job_id': task.id,
+            'state': task.state
+        }, 202)
+
+
+@api.route('/status/update-bulk/<string:job_id>')
+@api.param('job_id', 'The job identifier returned when the update was queued')
+class BulkStatusUpdateJob(Resource):
+    @api.doc('get_update_statuses_bulk_job')
+    @api.response(200, 'Success', bulk_job_model)
+    @api.response(500, 'Internal Server Error', error_model)
+    def get(self, job_id):
+        """Get the state of a bulk status update job"""
+        result = run_status_bulk.AsyncResult(job_id)
+        response = {'job_id': job_id, 'state': result.state}
+        if result.successful():
+            response.update(result.result)
+        elif result.failed():
+            # The exception text (e.g. SQL) stays in the server log
+            current_app.logger.error(f"Bulk status job {job_id} failed: {result.result!r}\n{result.traceback}")
+            response['error'] = 'Bulk status update failed'
+        return response, 200
 
 
 @api.route('/analytics/costs')
 class MaintenanceCostAnalytics(Resource):
     @api.doc('get_cost_analytics')
     @api.response(200, 'Success')
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
         """Get detailed cost analytics for maintenance"""
-        try:
-            analytics = MaintenanceService.get_cost_analytics()
-            return analytics, 200
-        
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        return cached_json_response(
+            COST_ANALYTICS_KEY,
+            current_app.config['ANALYTICS_CACHE_TTL'],
+            lambda: dumps_bytes(MaintenanceService.get_cost_analytics()),
+            max_age=current_app.config['COST_ANALYTICS_HTTP_MAX_AGE']
+        )
 
 
 @api.route('/analytics/trends')
@@ -463,55 +616,92 @@ class MaintenanceTrends(Resource):
     @api.doc('get_maintenance_trends',
              params={
                  'period': 'Time period: week, month, quarter, year (default: month)',
-                 'limit': 'Number of periods to return (default: 12)'
+                 'limit': f'Number of periods to return (default: 12, max: {MAX_TREND_PERIODS})'
              })
     @api.response(200, 'Success')
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
+    @api.response(400, 'Unknown period', error_model)
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
         """Get maintenance trends over time"""
-        try:
-            period = request.args.get('period', 'month')
-            limit = request.args.get('limit', 12, type=int)
-            
-            trends = MaintenanceService.get_maintenance_trends(period, limit)
-            return trends, 200
+        period = request.args.get('period', 'month')
+        if period not in TREND_PERIODS:
+            api.abort(400, f"period must be one of: {', '.join(TREND_PERIODS)}")
+        # Bounded so the cache holds a fixed number of period/limit combinations
+        limit = min(max(request.args.get('limit', 12, type=int), 1), MAX_TREND_PERIODS)
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        return cached_json_response(
+            TRENDS_KEY,
+            current_app.config['ANALYTICS_CACHE_TTL'],
+            lambda: dumps_bytes(MaintenanceService.get_maintenance_trends(period, limit)),
+            field=f'{period}:{limit}',
+            max_age=current_app.config['TRENDS_HTTP_MAX_AGE']
+        )
 
 
 @api.route('/overdue')
 class OverdueMaintenanceList(Resource):
-    @api.doc('list_overdue_maintenance')
-    @api.marshal_list_with(maintenance_item_model, code=200, description='Success')
+    @api.doc('list_overdue_maintenance',
+             params={
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
+             })
+    @api.response(200, 'Success', maintenance_item_page_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
-        """Get all overdue maintenance items"""
-        try:
-            items = MaintenanceService.get_overdue_items()
-            return items, 200
+        """Get a page of overdue maintenance items (Accept: application/x-ndjson streams all of them)"""
+        if wants_ndjson():
+            return ndjson_response(
+                MaintenanceService.stream_overdue_items(),
+                _marshal_list_item
+            )
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        page, per_page = page_args(request.args)
+        return cached_json_response(
+            OVERDUE_KEY,
+            current_app.config['OVERDUE_CACHE_TTL'],
+            lambda: dumps_bytes(marshal(
+                MaintenanceService.get_overdue_items(page, per_page),
+                maintenance_item_page_model
+            )),
+            field=f'{page}:{per_page}',
+            cacheable=is_cached_page(page, per_page)
+        )
 
 
 @api.route('/upcoming')
 class UpcomingMaintenanceList(Resource):
     @api.doc('list_upcoming_maintenance',
              params={
-                 'days': 'Number of days to look ahead (default: 30)'
+                 'days': f'Number of days to look ahead (default: 30, max: {MAX_UPCOMING_DAYS})',
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
              })
-    @api.marshal_list_with(maintenance_item_model, code=200, description='Success')
+    @api.response(200, 'Success', maintenance_item_page_model)
+    @api.response(304, 'Not Modified (If-None-Match matched the ETag)')
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
-        """Get upcoming maintenance items"""
-        try:
-            days = request.args.get('days', 30, type=int)
-            items = MaintenanceService.get_upcoming_items(days)
-            return items, 200
+        """Get a page of upcoming maintenance items (Accept: application/x-ndjson streams all of them)"""
+        # Bounded like page, so the cache holds a fixed number of days/page combinations
+        days = min(max(request.args.get('days', 30, type=int), 1), MAX_UPCOMING_DAYS)
+        if wants_ndjson():
+            return ndjson_response(
+                MaintenanceService.stream_upcoming_items(days),
+                _marshal_list_item
+            )
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        page, per_page = page_args(request.args)
+        return cached_json_response(
+            UPCOMING_KEY,
+            current_app.config['UPCOMING_CACHE_TTL'],
+            lambda: dumps_bytes(marshal(
+                MaintenanceService.get_upcoming_items(days, page, per_page),
+                maintenance_item_page_model
+            )),
+            field=f'{days}:{page}:{per_page}',
+            cacheable=is_cached_page(page, per_page)
+        )
 
 
 @api.route('/search')
@@ -526,35 +716,33 @@ class MaintenanceSearch(Resource):
     @api.response(500, 'Internal Server Error', error_model)
     def get(self):
         """Search maintenance items by query"""
-        try:
-            query = request.args.get('q', '')
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 10, type=int)
-            
-            result = MaintenanceService.search_maintenance(query, page, per_page)
-            return result, 200
+        query = request.args.get('q', '')
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 10, type=int)
         
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        result = MaintenanceService.search_maintenance(query, page, per_page)
+        return result, 200
 
 # ==================== Technician Resources ====================
 @api.route('/technicians')
 class TechnicianList(Resource):
-    @api.doc('list_technicians')
-    @api.marshal_list_with(technician_model, code=200)
+    @api.doc('list_technicians',
+             params={
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
+             })
+    @api.marshal_with(technician_page_model, code=200)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
     @require_auth
     def get(self):
-        """Get all technicians"""
-        try:
-            technicians = MaintenanceService.get_all_technicians()
-            return technicians, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        """Get a page of technicians"""
+        page, per_page = page_args(request.args)
+        technicians = MaintenanceService.get_all_technicians(page, per_page)
+        return technicians, 200
 
     @api.doc('create_technician')
-    @api.expect(technician_create_model, validate=True)
+    @api.expect(technician_create_model)
     @api.marshal_with(technician_model, code=201)
     @api.response(400, 'Validation Error', error_model)
     @api.response(500, 'Internal Server Error', error_model)
@@ -562,21 +750,15 @@ class TechnicianList(Resource):
     @require_auth
     def post(self):
         """Create a new technician"""
-        try:
-            schema = TechnicianCreateSchema()
-            data = schema.load(request.json)
-            technician = MaintenanceService.create_technician(data)
-            return technician.to_dict(), 201
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(technician_create_schema)
+        technician = MaintenanceService.create_technician(data)
+        return technician, 201
 
 @api.route('/technicians/<string:tech_id>')
 @api.param('tech_id', 'The technician ID')
 class TechnicianItem(Resource):
     @api.doc('update_technician')
-    @api.expect(technician_update_model, validate=True)
+    @api.expect(technician_update_model)
     @api.marshal_with(technician_model, code=200)
     @api.response(400, 'Validation Error', error_model)
     @api.response(404, 'Technician not found', error_model)
@@ -585,17 +767,11 @@ class TechnicianItem(Resource):
     @require_auth
     def put(self, tech_id):
         """Update a technician"""
-        try:
-            schema = TechnicianUpdateSchema()
-            data = schema.load(request.json)
-            technician = MaintenanceService.update_technician(tech_id, data)
-            if not technician:
-                api.abort(404, f'Technician {tech_id} not found')
-            return technician.to_dict(), 200
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(technician_update_schema)
+        technician = MaintenanceService.update_technician(tech_id, data)
+        if not technician:
+            api.abort(404, f'Technician {tech_id} not found')
+        return technician, 200
 
     @api.doc('delete_technician')
     @api.response(200, 'Success')
@@ -605,33 +781,33 @@ class TechnicianItem(Resource):
     @require_auth
     def delete(self, tech_id):
         """Delete a technician"""
-        try:
-            success = MaintenanceService.delete_technician(tech_id)
-            if not success:
-                api.abort(404, f'Technician {tech_id} not found')
-            return {'message': 'Technician deleted successfully'}, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        success = MaintenanceService.delete_technician(tech_id)
+        if not success:
+            api.abort(404, f'Technician {tech_id} not found')
+        return raw_response({'message': 'Technician deleted successfully'})
 
 # ==================== Part Resources ====================
 @api.route('/parts')
 class PartList(Resource):
-    @api.doc('list_parts', params={'q': 'Search query'})
-    @api.marshal_list_with(part_model, code=200)
+    @api.doc('list_parts',
+             params={
+                 'q': 'Search query',
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
+             })
+    @api.marshal_with(part_page_model, code=200)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
     @require_auth
     def get(self):
-        """Get all parts"""
-        try:
-            query = request.args.get('q')
-            parts = MaintenanceService.get_all_parts(query)
-            return parts, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        """Get a page of parts"""
+        query = request.args.get('q')
+        page, per_page = page_args(request.args)
+        parts = MaintenanceService.get_all_parts(query, page, per_page)
+        return parts, 200
 
     @api.doc('create_part')
-    @api.expect(part_create_model, validate=True)
+    @api.expect(part_create_model)
     @api.marshal_with(part_model, code=201)
     @api.response(400, 'Validation Error', error_model)
     @api.response(500, 'Internal Server Error', error_model)
@@ -639,21 +815,15 @@ class PartList(Resource):
     @require_auth
     def post(self):
         """Create a new part"""
-        try:
-            schema = PartCreateSchema()
-            data = schema.load(request.json)
-            part = MaintenanceService.create_part(data)
-            return part.to_dict(), 201
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(part_create_schema)
+        part = MaintenanceService.create_part(data)
+        return part, 201
 
 @api.route('/parts/<string:part_id>')
 @api.param('part_id', 'The part ID')
 class PartItem(Resource):
     @api.doc('update_part')
-    @api.expect(part_update_model, validate=True)
+    @api.expect(part_update_model)
     @api.marshal_with(part_model, code=200)
     @api.response(400, 'Validation Error', error_model)
     @api.response(404, 'Part not found', error_model)
@@ -662,17 +832,11 @@ class PartItem(Resource):
     @require_auth
     def put(self, part_id):
         """Update a part"""
-        try:
-            schema = PartUpdateSchema()
-            data = schema.load(request.json)
-            part = MaintenanceService.update_part(part_id, data)
-            if not part:
-                api.abort(404, f'Part {part_id} not found')
-            return part.to_dict(), 200
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(part_update_schema)
+        part = MaintenanceService.update_part(part_id, data)
+        if not part:
+            api.abort(404, f'Part {part_id} not found')
+        return part, 200
 
     @api.doc('delete_part')
     @api.response(200, 'Success')
@@ -682,32 +846,31 @@ class PartItem(Resource):
     @require_auth
     def delete(self, part_id):
         """Delete a part"""
-        try:
-            success = MaintenanceService.delete_part(part_id)
-            if not success:
-                api.abort(404, f'Part {part_id} not found')
-            return {'message': 'Part deleted successfully'}, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        success = MaintenanceService.delete_part(part_id)
+        if not success:
+            api.abort(404, f'Part {part_id} not found')
+        return raw_response({'message': 'Part deleted successfully'})
 
 # ==================== Recurring Schedule Resources ====================
 @api.route('/recurring-schedules')
 class RecurringScheduleList(Resource):
-    @api.doc('list_recurring_schedules')
-    @api.marshal_list_with(recurring_schedule_model, code=200)
+    @api.doc('list_recurring_schedules',
+             params={
+                 'page': 'Page number (default: 1)',
+                 'per_page': 'Items per page (default: 50, max: 200)'
+             })
+    @api.marshal_with(recurring_schedule_page_model, code=200)
     @api.response(500, 'Internal Server Error', error_model)
     @api.response(401, 'Unauthorized')
     @require_auth
     def get(self):
-        """Get all recurring schedules"""
-        try:
-            schedules = MaintenanceService.get_all_recurring_schedules()
-            return schedules, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        """Get a page of recurring schedules"""
+        page, per_page = page_args(request.args)
+        schedules = MaintenanceService.get_all_recurring_schedules(page, per_page)
+        return schedules, 200
 
     @api.doc('create_recurring_schedule')
-    @api.expect(recurring_schedule_create_model, validate=True)
+    @api.expect(recurring_schedule_create_model)
     @api.marshal_with(recurring_schedule_model, code=201)
     @api.response(400, 'Validation Error', error_model)
     @api.response(500, 'Internal Server Error', error_model)
@@ -715,21 +878,15 @@ class RecurringScheduleList(Resource):
     @require_auth
     def post(self):
         """Create a new recurring schedule"""
-        try:
-            schema = RecurringScheduleCreateSchema()
-            data = schema.load(request.json)
-            schedule = MaintenanceService.create_recurring_schedule(data)
-            return schedule.to_dict(), 201
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(recurring_schedule_create_schema)
+        schedule = MaintenanceService.create_recurring_schedule(data)
+        return schedule, 201
 
 @api.route('/recurring-schedules/<string:schedule_id>')
 @api.param('schedule_id', 'The schedule ID')
 class RecurringScheduleItem(Resource):
     @api.doc('update_recurring_schedule')
-    @api.expect(recurring_schedule_update_model, validate=True)
+    @api.expect(recurring_schedule_update_model)
     @api.marshal_with(recurring_schedule_model, code=200)
     @api.response(400, 'Validation Error', error_model)
     @api.response(404, 'Schedule not found', error_model)
@@ -738,17 +895,11 @@ class RecurringScheduleItem(Resource):
     @require_auth
     def put(self, schedule_id):
         """Update a recurring schedule"""
-        try:
-            schema = RecurringScheduleUpdateSchema()
-            data = schema.load(request.json)
-            schedule = MaintenanceService.update_recurring_schedule(schedule_id, data)
-            if not schedule:
-                api.abort(404, f'Schedule {schedule_id} not found')
-            return schedule.to_dict(), 200
-        except ValidationError as e:
-            api.abort(400, f'Validation error', errors=e.messages)
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        data = _load_body(recurring_schedule_update_schema)
+        schedule = MaintenanceService.update_recurring_schedule(schedule_id, data)
+        if not schedule:
+            api.abort(404, f'Schedule {schedule_id} not found')
+        return schedule, 200
 
     @api.doc('delete_recurring_schedule')
     @api.response(200, 'Success')
@@ -758,10 +909,7 @@ class RecurringScheduleItem(Resource):
     @require_auth
     def delete(self, schedule_id):
         """Delete a recurring schedule"""
-        try:
-            success = MaintenanceService.delete_recurring_schedule(schedule_id)
-            if not success:
-                api.abort(404, f'Schedule {schedule_id} not found')
-            return {'message': 'Schedule deleted successfully'}, 200
-        except Exception as e:
-            api.abort(500, f'Internal server error: {str(e)}')
+        success = MaintenanceService.delete_recurring_schedule(schedule_id)
+        if not success:
+            api.abort(404, f'Schedule {schedule_id} not found')
+        return raw_response({'message': 'Schedule deleted successfully'})
@@ -1,17 +1,30 @@
 from marshmallow import Schema, fields, validate
 
-class MaintenanceItemSchema(Schema):
+# Validators shared by the schemas below (built once, reused by every field)
+MAINTENANCE_STATUS = validate.OneOf(['overdue', 'due_soon', 'scheduled', 'in_progress', 'completed', 'cancelled'])
+MAINTENANCE_PRIORITY = validate.OneOf(['low', 'medium', 'high', 'critical'])
+TECHNICIAN_STATUS = validate.OneOf(['available', 'busy', 'off-duty'])
+SCHEDULE_FREQUENCY = validate.OneOf(['daily', 'weekly', 'monthly', 'quarterly', 'yearly', 'mileage-based'])
+NON_NEGATIVE = validate.Range(min=0)
+
+class ResponseSchema(Schema):
+    """Base for schemas that only serialize rows outwards; every field is dump-only"""
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('dump_only', tuple(self._declared_fields))
+        super().__init__(*args, **kwargs)
+
+class MaintenanceItemSchema(ResponseSchema):
     id = fields.Str(required=True)
     vehicle = fields.Str(required=True, data_key='vehicle')
     type = fields.Str(required=True)
     description = fields.Str()
     status = fields.Str(
         required=True,
-        validate=validate.OneOf(['overdue', 'due_soon', 'scheduled', 'in_progress', 'completed', 'cancelled'])
+        validate=MAINTENANCE_STATUS
     )
     priority = fields.Str(
         required=True,
-        validate=validate.OneOf(['low', 'medium', 'high', 'critical'])
+        validate=MAINTENANCE_PRIORITY
     )
     dueDate = fields.Date(required=True)
     scheduledDate = fields.DateTime()
@@ -33,15 +46,15 @@ class MaintenanceItemCreateSchema(Schema):
     vehicle_id = fields.Str(required=True, validate=validate.Length(min=1, max=50))
     type = fields.Str(required=True, validate=validate.Length(min=1, max=100))
     description = fields.Str()
-    status = fields.Str(validate=validate.OneOf(['overdue', 'due_soon', 'scheduled', 'in_progress', 'completed', 'cancelled']))
+    status = fields.Str(validate=MAINTENANCE_STATUS)
     priority = fields.Str(
         required=True,
-        validate=validate.OneOf(['low', 'medium', 'high', 'critical'])
+        validate=MAINTENANCE_PRIORITY
     )
     due_date = fields.Date(required=True)
-    current_mileage = fields.Int(required=True, validate=validate.Range(min=0))
-    due_mileage = fields.Int(required=True, validate=validate.Range(min=0))
-    estimated_cost = fields.Float(validate=validate.Range(min=0))
+    current_mileage = fields.Int(required=True, validate=NON_NEGATIVE)
+    due_mileage = fields.Int(required=True, validate=NON_NEGATIVE)
+    estimated_cost = fields.Float(validate=NON_NEGATIVE)
     assigned_to = fields.Str()
     assigned_technician = fields.Str()
     notes = fields.Str()
@@ -51,18 +64,18 @@ class MaintenanceItemUpdateSchema(Schema):
     type = fields.Str(validate=validate.Length(min=1, max=100))
     description = fields.Str()
     status = fields.Str(
-        validate=validate.OneOf(['overdue', 'due_soon', 'scheduled', 'in_progress', 'completed', 'cancelled'])
+        validate=MAINTENANCE_STATUS
     )
     priority = fields.Str(
-        validate=validate.OneOf(['low', 'medium', 'high', 'critical'])
+        validate=MAINTENANCE_PRIORITY
     )
     due_date = fields.Date()
     scheduled_date = fields.DateTime()
     completed_date = fields.DateTime()
-    current_mileage = fields.Int(validate=validate.Range(min=0))
-    due_mileage = fields.Int(validate=validate.Range(min=0))
-    estimated_cost = fields.Float(validate=validate.Range(min=0))
-    actual_cost = fields.Float(validate=validate.Range(min=0))
+    current_mileage = fields.Int(validate=NON_NEGATIVE)
+    due_mileage = fields.Int(validate=NON_NEGATIVE)
+    estimated_cost = fields.Float(validate=NON_NEGATIVE)
+    actual_cost = fields.Float(validate=NON_NEGATIVE)
     assigned_to = fields.Str()
     assigned_technician = fields.Str()
     notes = fields.Str()
@@ -70,13 +83,13 @@ class MaintenanceItemUpdateSchema(Schema):
     attachments = fields.List(fields.Dict())
 
 # Technician Schemas
-class TechnicianSchema(Schema):
+class TechnicianSchema(ResponseSchema):
     id = fields.Str(dump_only=True)
     name = fields.Str(required=True)
     email = fields.Email(required=True)
     phone = fields.Str()
     specialization = fields.List(fields.Str())
-    status = fields.Str(validate=validate.OneOf(['available', 'busy', 'off-duty']))
+    status = fields.Str(validate=TECHNICIAN_STATUS)
     rating = fields.Float()
     completed_jobs = fields.Int()
     active_jobs = fields.Int()
@@ -89,7 +102,7 @@ class TechnicianCreateSchema(Schema):
     email = fields.Email(required=True)
     phone = fields.Str(required=True)
     specialization = fields.List(fields.Str())
-    status = fields.Str(validate=validate.OneOf(['available', 'busy', 'off-duty']))
+    status = fields.Str(validate=TECHNICIAN_STATUS)
     certifications = fields.List(fields.Str())
     hourly_rate = fields.Float(required=True)
     join_date = fields.Date()
@@ -99,7 +112,7 @@ class TechnicianUpdateSchema(Schema):
     email = fields.Email()
     phone = fields.Str()
     specialization = fields.List(fields.Str())
-    status = fields.Str(validate=validate.OneOf(['available', 'busy', 'off-duty']))
+    status = fields.Str(validate=TECHNICIAN_STATUS)
     rating = fields.Float()
     completed_jobs = fields.Int()
     active_jobs = fields.Int()
@@ -107,7 +120,7 @@ class TechnicianUpdateSchema(Schema):
     hourly_rate = fields.Float()
 
 # Part Schemas
-class PartSchema(Schema):
+class PartSchema(ResponseSchema):
     id = fields.Str(dump_only=True)
     name = fields.Str(required=True)
     part_number = fields.Str(required=True)
@@ -124,9 +137,9 @@ class PartCreateSchema(Schema):
     name = fields.Str(required=True)
     part_number = fields.Str(required=True)
     category = fields.Str(required=True)
-    quantity = fields.Int(required=True, validate=validate.Range(min=0))
-    min_quantity = fields.Int(required=True, validate=validate.Range(min=0))
-    unit_cost = fields.Float(required=True, validate=validate.Range(min=0))
+    quantity = fields.Int(required=True, validate=NON_NEGATIVE)
+    min_quantity = fields.Int(required=True, validate=NON_NEGATIVE)
+    unit_cost = fields.Float(required=True, validate=NON_NEGATIVE)
     supplier = fields.Str()
     location = fields.Str()
     used_in = fields.List(fields.Str())
@@ -135,22 +148,22 @@ class PartUpdateSchema(Schema):
     name = fields.Str()
     part_number = fields.Str()
     category = fields.Str()
-    quantity = fields.Int(validate=validate.Range(min=0))
-    min_quantity = fields.Int(validate=validate.Range(min=0))
-    unit_cost = fields.Float(validate=validate.Range(min=0))
+    quantity = fields.Int(validate=NON_NEGATIVE)
+    min_quantity = fields.Int(validate=NON_NEGATIVE)
+    unit_cost = fields.Float(validate=NON_NEGATIVE)
     supplier = fields.Str()
     location = fields.Str()
     last_restocked = fields.Date()
     used_in = fields.List(fields.Str())
 
 # Recurring Schedule Schemas
-class RecurringScheduleSchema(Schema):
+class RecurringScheduleSchema(ResponseSchema):
     id = fields.Str(dump_only=True)
     name = fields.Str(required=True)
     vehicle_id = fields.Str(required=True)
     maintenance_type = fields.Str(required=True)
     description = fields.Str()
-    frequency = fields.Str(required=True, validate=validate.OneOf(['daily', 'weekly', 'monthly', 'quarterly', 'yearly', 'mileage-based']))
+    frequency = fields.Str(required=True, validate=SCHEDULE_FREQUENCY)
     frequency_value = fields.Int(required=True)
     estimated_cost = fields.Float()
     estimated_duration = fields.Float()
@@ -166,20 +179,20 @@ class RecurringScheduleCreateSchema(Schema):
     vehicle_id = fields.Str(required=True)
     maintenance_type = fields.Str(required=True)
     description = fields.Str()
-    frequency = fields.Str(required=True, validate=validate.OneOf(['daily', 'weekly', 'monthly', 'quarterly', 'yearly', 'mileage-based']))
+    frequency = fields.Str(required=True, validate=SCHEDULE_FREQUENCY)
     frequency_value = fields.Int(required=True, validate=validate.Range(min=1))
-    estimated_cost = fields.Float(validate=validate.Range(min=0))
-    estimated_duration = fields.Float(validate=validate.Range(min=0))
+    estimated_cost = fields.Float(validate=NON_NEGATIVE)
+    estimated_duration = fields.Float(validate=NON_NEGATIVE)
     assigned_to = fields.Str()
     is_active = fields.Bool()
 
 class RecurringScheduleUpdateSchema(Schema):
     name = fields.Str()
     description = fields.Str()
-    frequency = fields.Str(validate=validate.OneOf(['daily', 'weekly', 'monthly', 'quarterly', 'yearly', 'mileage-based']))
+    frequency = fields.Str(validate=SCHEDULE_FREQUENCY)
     frequency_value = fields.Int(validate=validate.Range(min=1))
-    estimated_cost = fields.Float(validate=validate.Range(min=0))
-    estimated_duration = fields.Float(validate=validate.Range(min=0))
+    estimated_cost = fields.Float(validate=NON_NEGATIVE)
+    estimated_duration = fields.Float(validate=NON_NEGATIVE)
     assigned_to = fields.Str()
     is_active = fields.Bool()
     last_executed = fields.DateTime()
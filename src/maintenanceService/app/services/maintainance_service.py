@@ -1,7 +1,46 @@
-from app import db
+from app import db, cache
+from app.utils.cache import (
+    SUMMARY_KEY, OVERDUE_KEY, UPCOMING_KEY, COST_ANALYTICS_KEY, TRENDS_KEY,
+    history_key, item_key, item_etag_key
+)
+from app.utils.pagination import DEFAULT_PAGE_SIZE, encode_cursor
 from app.models.maintainance import MaintenanceItem, MaintenanceStatus, MaintenancePriority, Technician, TechnicianStatus, Part, RecurringSchedule, FrequencyType
 from datetime import datetime, date, timedelta
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, not_, tuple_, text, select, update
+from sqlalchemy.exc import OperationalError
+
+# Upper bound for exact COUNT(*) on filtered item lists
+EXACT_COUNT_TIMEOUT = '200ms'
+
+# An item is due soon within this many days / km of its due date / mileage
+DUE_SOON_DAYS = 7
+DUE_SOON_MILEAGE = 500
+
+# Periods get_maintenance_trends can group by, and the most periods it returns
+TREND_PERIODS = ('week', 'month', 'quarter', 'year')
+MAX_TREND_PERIODS = 60
+
+# Furthest ahead get_upcoming_items looks, in days
+MAX_UPCOMING_DAYS = 365
+
+# Rows claimed per UPDATE by the bulk status sweep
+BULK_STATUS_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip when streaming a full list
+STREAM_BATCH_SIZE = 500
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+# Filter key -> SQL criterion builder for get_all_maintenance_items
+ITEM_FILTERS = {
+    'vehicle': lambda value: MaintenanceItem.vehicle_id == value,
+    'status': lambda value: MaintenanceItem.status.in_(_as_list(value)),
+    'priority': lambda value: MaintenanceItem.priority.in_(_as_list(value)),
+    'assignedTo': lambda value: MaintenanceItem.assigned_to == value,
+    'dueDateFrom': lambda value: MaintenanceItem.due_date >= value,
+    'dueDateTo': lambda value: MaintenanceItem.due_date <= value,
+}
 
 class MaintenanceService:
     
@@ -57,8 +96,23 @@ class MaintenanceService:
         
         db.session.add(maintenance_item)
         db.session.commit()
+        MaintenanceService._invalidate_caches([maintenance_item.vehicle_id])
         return maintenance_item
     
+    @staticmethod
+    def _invalidate_caches(vehicle_ids, item_ids=()):
+        """Drop the cached aggregates, the affected vehicles' histories and the changed items after a write"""
+        cache.delete(
+            SUMMARY_KEY,
+            OVERDUE_KEY,
+            UPCOMING_KEY,
+            COST_ANALYTICS_KEY,
+            TRENDS_KEY,
+            *(history_key(vid) for vid in set(vehicle_ids)),
+            *(item_key(item_id) for item_id in item_ids),
+            *(item_etag_key(item_id) for item_id in item_ids)
+        )
+    
     @staticmethod
     def _determine_status(due_date, current_mileage, due_mileage):
         """Automatically determine maintenance status"""
@@ -70,60 +124,105 @@ class MaintenanceService:
         if days_until_due < 0 or current_mileage >= due_mileage:
             return MaintenanceStatus.OVERDUE
         
-        # Due soon if within 7 days or within 500 km
-        if days_until_due <= 7 or mileage_diff <= 500:
+        # Due soon if within DUE_SOON_DAYS days or within DUE_SOON_MILEAGE km
+        if days_until_due <= DUE_SOON_DAYS or mileage_diff <= DUE_SOON_MILEAGE:
             return MaintenanceStatus.DUE_SOON
         
         return MaintenanceStatus.SCHEDULED
     
     @staticmethod
-    def get_all_maintenance_items(filters=None, page=1, per_page=10):
-        """Get all maintenance items with optional filtering and pagination"""
-        query = MaintenanceItem.query
+    def get_all_maintenance_items(filters=None, after=None, per_page=10):
+        """Get maintenance items with optional filtering and keyset pagination
         
-        if filters:
-            if 'vehicle' in filters:
-                query = query.filter(MaintenanceItem.vehicle_id == filters['vehicle'])
-            
-            if 'status' in filters:
-                statuses = filters['status'] if isinstance(filters['status'], list) else [filters['status']]
-                query = query.filter(MaintenanceItem.status.in_(statuses))
-            
-            if 'priority' in filters:
-                priorities = filters['priority'] if isinstance(filters['priority'], list) else [filters['priority']]
-                query = query.filter(MaintenanceItem.priority.in_(priorities))
-            
-            if 'assignedTo' in filters:
-                query = query.filter(MaintenanceItem.assigned_to == filters['assignedTo'])
-            
-            if 'dueDateFrom' in filters:
-                query = query.filter(MaintenanceItem.due_date >= filters['dueDateFrom'])
-            
-            if 'dueDateTo' in filters:
-                query = query.filter(MaintenanceItem.due_date <= filters['dueDateTo'])
+        `after` is the decoded (created_at, id) of the last item on the previous page.
+        Only the IDs of the page are returned (newest first) so callers can hydrate them
+        from the item cache; `next_cursor` is None on the last page.
+        """
+        query = MaintenanceItem.query.with_entities(MaintenanceItem.id, MaintenanceItem.created_at)
+        
+        for key, value in (filters or {}).items():
+            criterion = ITEM_FILTERS.get(key)
+            if criterion is not None:
+                query = query.filter(criterion(value))
+        
+        filtered_query = query
+        
+        # Seek past the previous page instead of using OFFSET
+        if after:
+            query = query.filter(
+                tuple_(MaintenanceItem.created_at, MaintenanceItem.id) < tuple_(*after)
+            )
         
-        # Order by priority and due date
+        # Matches ix_maintenance_items_created_at_id
         query = query.order_by(
-            MaintenanceItem.status.desc(),
-            MaintenanceItem.priority.desc(),
-            MaintenanceItem.due_date.asc()
+            MaintenanceItem.created_at.desc(),
+            MaintenanceItem.id.desc()
         )
         
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(per_page + 1).all()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
         
-        return {
-            'items': [item.to_dict() for item in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'page': page,
-            'per_page': per_page
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        
+        result = {
+            'item_ids': [row.id for row in rows],
+            'per_page': per_page,
+            'next_cursor': next_cursor
         }
+        result['total_estimate'] = MaintenanceService._estimate_total(filtered_query, bool(filters))
+        return result
+    
+    @staticmethod
+    def _estimate_total(query, filtered):
+        """Approximate row count for a list query
+        
+        Unfiltered lists use the planner's pg_class.reltuples estimate. Filtered lists get an
+        exact COUNT(*) bounded by EXACT_COUNT_TIMEOUT; None means the count was too slow.
+        """
+        if db.session.get_bind().dialect.name != 'postgresql':
+            return query.order_by(None).count()
+        
+        if not filtered:
+            estimate = db.session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+                {'table': MaintenanceItem.__tablename__}
+            ).scalar()
+            # reltuples is -1 until the table has been analyzed
+            if estimate is not None and estimate >= 0:
+                return estimate
+        
+        # The savepoint scopes the SET LOCAL timeout to this count only
+        savepoint = db.session.begin_nested()
+        try:
+            db.session.execute(
+                text("SELECT set_config('statement_timeout', :timeout, true)"),
+                {'timeout': EXACT_COUNT_TIMEOUT}
+            )
+            return query.order_by(None).count()
+        except OperationalError:
+            return None
+        finally:
+            savepoint.rollback()
     
     @staticmethod
     def get_maintenance_item(item_id):
         """Get a single maintenance item by ID"""
         return MaintenanceItem.query.get(item_id)
     
+    @staticmethod
+    def get_maintenance_items_by_ids(item_ids):
+        """Get several maintenance items in one query, in the order of item_ids"""
+        if not item_ids:
+            return []
+        items = MaintenanceItem.query.filter(MaintenanceItem.id.in_(item_ids)).all()
+        by_id = {item.id: item for item in items}
+        return [by_id[item_id] for item_id in item_ids if item_id in by_id]
+    
     @staticmethod
     def update_maintenance_item(item_id, data):
         """Update a maintenance item"""
@@ -161,6 +260,7 @@ class MaintenanceService:
         
         item.updated_at = datetime.utcnow()
         db.session.commit()
+        MaintenanceService._invalidate_caches([item.vehicle_id], [item.id])
         return item
     
     @staticmethod
@@ -170,125 +270,176 @@ class MaintenanceService:
         if not item:
             return False
         
+        vehicle_id = item.vehicle_id
         db.session.delete(item)
         db.session.commit()
+        MaintenanceService._invalidate_caches([vehicle_id], [item_id])
         return True
     
     @staticmethod
     def get_maintenance_summary():
         """Get summary statistics for maintenance items"""
-        total = MaintenanceItem.query.count()
-        
-        # Count by status
-        by_status = {}
-        for status in MaintenanceStatus:
-            count = MaintenanceItem.query.filter(MaintenanceItem.status == status).count()
-            by_status[status.value] = count
-        
-        # Count by priority
-        by_priority = {}
-        for priority in MaintenancePriority:
-            count = MaintenanceItem.query.filter(MaintenanceItem.priority == priority).count()
-            by_priority[priority.value] = count
-        
-        overdue_count = MaintenanceItem.query.filter(
-            MaintenanceItem.status == MaintenanceStatus.OVERDUE
-        ).count()
-        
-        due_soon_count = MaintenanceItem.query.filter(
-            MaintenanceItem.status == MaintenanceStatus.DUE_SOON
-        ).count()
-        
-        # Calculate total estimated cost for active maintenance
-        total_estimated_cost = db.session.query(
-            db.func.sum(MaintenanceItem.estimated_cost)
-        ).filter(
-            MaintenanceItem.status.in_([
-                MaintenanceStatus.SCHEDULED, 
-                MaintenanceStatus.IN_PROGRESS,
-                MaintenanceStatus.DUE_SOON,
-                MaintenanceStatus.OVERDUE
-            ])
-        ).scalar() or 0.0
-        
-        # Calculate total actual cost for completed maintenance
-        total_actual_cost = db.session.query(
+        # One grouped query per dimension instead of one COUNT per status / priority
+        status_rows = db.session.query(
+            MaintenanceItem.status,
+            db.func.count(MaintenanceItem.id),
+            db.func.sum(MaintenanceItem.estimated_cost),
             db.func.sum(MaintenanceItem.actual_cost)
-        ).filter(
-            MaintenanceItem.status == MaintenanceStatus.COMPLETED
-        ).scalar() or 0.0
+        ).group_by(MaintenanceItem.status).all()
+        
+        priority_counts = dict(db.session.query(
+            MaintenanceItem.priority,
+            db.func.count(MaintenanceItem.id)
+        ).group_by(MaintenanceItem.priority).all())
+        
+        status_counts = {status: count for status, count, _, _ in status_rows}
+        by_status = {status.value: status_counts.get(status, 0) for status in MaintenanceStatus}
+        by_priority = {priority.value: priority_counts.get(priority, 0) for priority in MaintenancePriority}
+        
+        # Total estimated cost for active maintenance
+        active_statuses = {
+            MaintenanceStatus.SCHEDULED,
+            MaintenanceStatus.IN_PROGRESS,
+            MaintenanceStatus.DUE_SOON,
+            MaintenanceStatus.OVERDUE
+        }
+        total_estimated_cost = sum(
+            estimated or 0.0 for status, _, estimated, _ in status_rows if status in active_statuses
+        )
+        
+        # Total actual cost for completed maintenance
+        total_actual_cost = sum(
+            actual or 0.0 for status, _, _, actual in status_rows if status == MaintenanceStatus.COMPLETED
+        )
         
         return {
-            'total_items': total,
+            'total_items': sum(status_counts.values()),
             'by_status': by_status,
             'by_priority': by_priority,
             'total_estimated_cost': float(total_estimated_cost),
             'total_actual_cost': float(total_actual_cost),
-            'overdue_count': overdue_count,
-            'due_soon_count': due_soon_count
+            'overdue_count': by_status[MaintenanceStatus.OVERDUE.value],
+            'due_soon_count': by_status[MaintenanceStatus.DUE_SOON.value]
         }
     
     @staticmethod
-    def get_vehicle_maintenance_history(vehicle_id):
-        """Get maintenance history for a specific vehicle"""
-        items = MaintenanceItem.query.filter(
+    def _vehicle_history_query(vehicle_id):
+        return MaintenanceItem.query.filter(
             MaintenanceItem.vehicle_id == vehicle_id
-        ).order_by(MaintenanceItem.due_date.desc()).all()
+        ).order_by(MaintenanceItem.due_date.desc(), MaintenanceItem.id.desc())
+    
+    @staticmethod
+    def get_vehicle_maintenance_history(vehicle_id, page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of maintenance history for a specific vehicle"""
+        query = MaintenanceService._vehicle_history_query(vehicle_id)
+        return MaintenanceService._paginate(query, page, per_page)
+    
+    @staticmethod
+    def stream_vehicle_maintenance_history(vehicle_id):
+        """Iterate a vehicle's full maintenance history, STREAM_BATCH_SIZE rows at a time"""
+        return MaintenanceService._vehicle_history_query(vehicle_id).yield_per(STREAM_BATCH_SIZE)
+    
+    @staticmethod
+    def _paginate(query, page, per_page):
+        """Run one page of query and return it in the shared pagination format
+        
+        Items are the ORM rows themselves; the routes marshal their attributes directly.
+        """
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        return [item.to_dict() for item in items]
+        return {
+            'items': pagination.items,
+            'total': pagination.total,
+            'pages': pagination.pages,
+            'page': page,
+            'per_page': per_page
+        }
     
     @staticmethod
-    def update_maintenance_status_bulk():
-        """Background job to update maintenance statuses based on current date and mileage"""
-        items = MaintenanceItem.query.filter(
-            MaintenanceItem.status.in_([MaintenanceStatus.SCHEDULED, MaintenanceStatus.DUE_SOON])
-        ).all()
-        
-        updated_count = 0
-        for item in items:
-            new_status = MaintenanceService._determine_status(
-                item.due_date,
-                item.current_mileage,
-                item.due_mileage
-            )
-            if item.status != new_status:
-                item.status = new_status
-                item.updated_at = datetime.utcnow()
-                updated_count += 1
+    def update_maintenance_status_bulk(chunk_size=BULK_STATUS_CHUNK_SIZE):
+        """Background job to update maintenance statuses based on current date and mileage
         
-        db.session.commit()
-        return updated_count
+        Mirrors _determine_status as one set-based UPDATE per status transition. Each UPDATE
+        claims at most chunk_size rows with FOR UPDATE SKIP LOCKED and commits per chunk, so
+        concurrent workers split the sweep instead of waiting on each other's locks.
+        """
+        today = date.today()
+        is_overdue = or_(
+            MaintenanceItem.due_date < today,
+            MaintenanceItem.current_mileage >= MaintenanceItem.due_mileage
+        )
+        is_due_soon = and_(
+            not_(is_overdue),
+            or_(
+                MaintenanceItem.due_date <= today + timedelta(days=DUE_SOON_DAYS),
+                MaintenanceItem.due_mileage - MaintenanceItem.current_mileage <= DUE_SOON_MILEAGE
+            )
+        )
+        is_scheduled = not_(or_(is_overdue, is_due_soon))
+        
+        # (new status, statuses it can be reached from, rule)
+        transitions = [
+            (MaintenanceStatus.OVERDUE, [MaintenanceStatus.SCHEDULED, MaintenanceStatus.DUE_SOON], is_overdue),
+            (MaintenanceStatus.DUE_SOON, [MaintenanceStatus.SCHEDULED], is_due_soon),
+            (MaintenanceStatus.SCHEDULED, [MaintenanceStatus.DUE_SOON], is_scheduled),
+        ]
+        
+        updated = []
+        for new_status, from_statuses, rule in transitions:
+            while True:
+                chunk = select(MaintenanceItem.id).where(
+                    MaintenanceItem.status.in_(from_statuses),
+                    rule
+                ).limit(chunk_size).with_for_update(skip_locked=True).scalar_subquery()
+                
+                rows = db.session.execute(
+                    update(MaintenanceItem)
+                    .where(MaintenanceItem.id.in_(chunk))
+                    .values(status=new_status, updated_at=datetime.utcnow())
+                    .returning(MaintenanceItem.id, MaintenanceItem.vehicle_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                db.session.commit()
+                
+                updated.extend(rows)
+                if len(rows) < chunk_size:
+                    break
+        
+        if updated:
+            MaintenanceService._invalidate_caches(
+                [row.vehicle_id for row in updated],
+                [row.id for row in updated]
+            )
+        return len(updated)
     
     @staticmethod
     def get_cost_analytics():
         """Get detailed cost analytics"""
-        # Total costs
-        total_estimated = db.session.query(
-            db.func.sum(MaintenanceItem.estimated_cost)
-        ).scalar() or 0.0
-        
-        total_actual = db.session.query(
+        # Grouped aggregates replace the per-vehicle / per-type follow-up queries.
+        # SUM skips NULLs, which matches the previous actual_cost IS NOT NULL filters.
+        vehicle_rows = db.session.query(
+            MaintenanceItem.vehicle_id,
+            db.func.sum(MaintenanceItem.estimated_cost),
             db.func.sum(MaintenanceItem.actual_cost)
-        ).filter(
-            MaintenanceItem.actual_cost.isnot(None)
-        ).scalar() or 0.0
+        ).group_by(MaintenanceItem.vehicle_id).all()
+        
+        type_rows = db.session.query(
+            MaintenanceItem.type,
+            db.func.sum(MaintenanceItem.estimated_cost),
+            db.func.sum(MaintenanceItem.actual_cost),
+            db.func.count(MaintenanceItem.id)
+        ).group_by(MaintenanceItem.type).all()
+        
+        status_counts = dict(db.session.query(
+            MaintenanceItem.status,
+            db.func.count(MaintenanceItem.id)
+        ).group_by(MaintenanceItem.status).all())
         
         # Cost by vehicle
         by_vehicle = {}
-        vehicles = db.session.query(MaintenanceItem.vehicle_id).distinct().all()
-        
-        for (vehicle_id,) in vehicles:
-            vehicle_estimated = db.session.query(
-                db.func.sum(MaintenanceItem.estimated_cost)
-            ).filter(MaintenanceItem.vehicle_id == vehicle_id).scalar() or 0.0
-            
-            vehicle_actual = db.session.query(
-                db.func.sum(MaintenanceItem.actual_cost)
-            ).filter(
-                MaintenanceItem.vehicle_id == vehicle_id,
-                MaintenanceItem.actual_cost.isnot(None)
-            ).scalar() or 0.0
-            
+        for vehicle_id, vehicle_estimated, vehicle_actual in vehicle_rows:
+            vehicle_estimated = vehicle_estimated or 0.0
+            vehicle_actual = vehicle_actual or 0.0
             by_vehicle[vehicle_id] = {
                 'estimated': float(vehicle_estimated),
                 'actual': float(vehicle_actual),
@@ -297,29 +448,27 @@ class MaintenanceService:
         
         # Cost by maintenance type
         by_type = {}
-        types = db.session.query(MaintenanceItem.type).distinct().all()
-        
-        for (maint_type,) in types:
-            type_estimated = db.session.query(
-                db.func.sum(MaintenanceItem.estimated_cost)
-            ).filter(MaintenanceItem.type == maint_type).scalar() or 0.0
-            
-            type_actual = db.session.query(
-                db.func.sum(MaintenanceItem.actual_cost)
-            ).filter(
-                MaintenanceItem.type == maint_type,
-                MaintenanceItem.actual_cost.isnot(None)
-            ).scalar() or 0.0
-            
+        for maint_type, type_estimated, type_actual, type_count in type_rows:
             by_type[maint_type] = {
-                'estimated': float(type_estimated),
-                'actual': float(type_actual),
-                'count': MaintenanceItem.query.filter(MaintenanceItem.type == maint_type).count()
+                'estimated': float(type_estimated or 0.0),
+                'actual': float(type_actual or 0.0),
+                'count': type_count
             }
         
+        # Total costs
+        total_estimated = sum(row[1] or 0.0 for row in vehicle_rows)
+        total_actual = sum(row[2] or 0.0 for row in vehicle_rows)
+        
         variance = total_actual - total_estimated
         variance_percent = (variance / total_estimated * 100) if total_estimated > 0 else 0
         
+        pending_statuses = [
+            MaintenanceStatus.SCHEDULED,
+            MaintenanceStatus.DUE_SOON,
+            MaintenanceStatus.OVERDUE,
+            MaintenanceStatus.IN_PROGRESS
+        ]
+        
         return {
             'total_estimated': float(total_estimated),
             'total_actual': float(total_actual),
@@ -327,17 +476,8 @@ class MaintenanceService:
             'variance_percent': float(variance_percent),
             'by_vehicle': by_vehicle,
             'by_type': by_type,
-            'completed_count': MaintenanceItem.query.filter(
-                MaintenanceItem.status == MaintenanceStatus.COMPLETED
-            ).count(),
-            'pending_count': MaintenanceItem.query.filter(
-                MaintenanceItem.status.in_([
-                    MaintenanceStatus.SCHEDULED,
-                    MaintenanceStatus.DUE_SOON,
-                    MaintenanceStatus.OVERDUE,
-                    MaintenanceStatus.IN_PROGRESS
-                ])
-            ).count()
+            'completed_count': status_counts.get(MaintenanceStatus.COMPLETED, 0),
+            'pending_count': sum(status_counts.get(status, 0) for status in pending_statuses)
         }
     
     @staticmethod
@@ -394,28 +534,42 @@ class MaintenanceService:
         return trends
     
     @staticmethod
-    def get_overdue_items():
-        """Get all overdue maintenance items"""
-        items = MaintenanceItem.query.filter(
+    def _overdue_query():
+        return MaintenanceItem.query.filter(
             MaintenanceItem.status == MaintenanceStatus.OVERDUE
-        ).order_by(MaintenanceItem.due_date.asc()).all()
-        
-        return [item.to_dict() for item in items]
+        ).order_by(MaintenanceItem.due_date.asc(), MaintenanceItem.id.asc())
+    
+    @staticmethod
+    def get_overdue_items(page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of overdue maintenance items"""
+        return MaintenanceService._paginate(MaintenanceService._overdue_query(), page, per_page)
+    
+    @staticmethod
+    def stream_overdue_items():
+        """Iterate all overdue maintenance items, STREAM_BATCH_SIZE rows at a time"""
+        return MaintenanceService._overdue_query().yield_per(STREAM_BATCH_SIZE)
     
     @staticmethod
-    def get_upcoming_items(days=30):
-        """Get upcoming maintenance items"""
+    def _upcoming_query(days):
         future_date = date.today() + timedelta(days=days)
         
-        items = MaintenanceItem.query.filter(
+        return MaintenanceItem.query.filter(
             MaintenanceItem.status.in_([
                 MaintenanceStatus.SCHEDULED,
                 MaintenanceStatus.DUE_SOON
             ]),
             MaintenanceItem.due_date <= future_date
-        ).order_by(MaintenanceItem.due_date.asc()).all()
-        
-        return [item.to_dict() for item in items]
+        ).order_by(MaintenanceItem.due_date.asc(), MaintenanceItem.id.asc())
+    
+    @staticmethod
+    def get_upcoming_items(days=30, page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of upcoming maintenance items"""
+        return MaintenanceService._paginate(MaintenanceService._upcoming_query(days), page, per_page)
+    
+    @staticmethod
+    def stream_upcoming_items(days=30):
+        """Iterate all upcoming maintenance items, STREAM_BATCH_SIZE rows at a time"""
+        return MaintenanceService._upcoming_query(days).yield_per(STREAM_BATCH_SIZE)
     
     @staticmethod
     def search_maintenance(query, page=1, per_page=10):
@@ -431,22 +585,13 @@ class MaintenanceService:
             )
         ).order_by(MaintenanceItem.due_date.desc())
         
-        pagination = search_query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        return {
-            'items': [item.to_dict() for item in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'page': page,
-            'per_page': per_page
-        }
+        return MaintenanceService._paginate(search_query, page, per_page)
 
     # ==================== Technician Methods ====================
     @staticmethod
-    def get_all_technicians():
-        """Get all technicians"""
-        technicians = Technician.query.all()
-        return [t.to_dict() for t in technicians]
+    def get_all_technicians(page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of technicians"""
+        return MaintenanceService._paginate(Technician.query.order_by(Technician.id), page, per_page)
 
     @staticmethod
     def create_technician(data):
@@ -496,8 +641,8 @@ class MaintenanceService:
 
     # ==================== Part Methods ====================
     @staticmethod
-    def get_all_parts(search_query=None):
-        """Get all parts, optionally filtered by search query"""
+    def get_all_parts(search_query=None, page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of parts, optionally filtered by search query"""
         query = Part.query
         if search_query:
             query = query.filter(
@@ -507,8 +652,7 @@ class MaintenanceService:
                     Part.category.ilike(f'%{search_query}%')
                 )
             )
-        parts = query.all()
-        return [p.to_dict() for p in parts]
+        return MaintenanceService._paginate(query.order_by(Part.id), page, per_page)
 
     @staticmethod
     def create_part(data):
@@ -561,10 +705,9 @@ class MaintenanceService:
 
     # ==================== Recurring Schedule Methods ====================
     @staticmethod
-    def get_all_recurring_schedules():
-        """Get all recurring schedules"""
-        schedules = RecurringSchedule.query.all()
-        return [s.to_dict() for s in schedules]
+    def get_all_recurring_schedules(page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Get a page of recurring schedules"""
+        return MaintenanceService._paginate(RecurringSchedule.query.order_by(RecurringSchedule.id), page, per_page)
 
     @staticmethod
     def create_recurring_schedule(data):
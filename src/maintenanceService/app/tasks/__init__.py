@@ -0,0 +1,2 @@
+from app.tasks.celery_app import celery_init_app
+from app.tasks.maintenance_tasks import run_status_bulk
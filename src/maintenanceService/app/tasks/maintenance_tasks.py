@@ -0,0 +1,22 @@
+"""
+Background jobs for maintenance items
+"""
+
+from celery import shared_task
+from app import cache
+from app.services.maintainance_service import MaintenanceService
+from app.utils.cache import STATUS_BULK_LOCK_KEY
+
+
+@shared_task(ignore_result=False)
+def run_status_bulk(lock_token):
+    """Recompute statuses of scheduled / due-soon items from due dates and mileage
+
+    Releases the sweep lock taken (under lock_token) when the job was queued; a lock
+    that has since expired and been taken by another sweep is left alone.
+    """
+    try:
+        updated = MaintenanceService.update_maintenance_status_bulk()
+    finally:
+        cache.release_lock(STATUS_BULK_LOCK_KEY, lock_token)
+    return {'updated_count': updated}
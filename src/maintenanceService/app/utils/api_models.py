@@ -0,0 +1,14 @@
+"""
+Flask-RESTX model helpers
+EnumValue lets models marshal ORM objects directly.
+"""
+
+from enum import Enum
+from flask_restx import fields
+
+
+class EnumValue(fields.String):
+    """String field that renders Enum members by their value (ORM objects carry the member)"""
+
+    def format(self, value):
+        return super().format(value.value if isinstance(value, Enum) else value)
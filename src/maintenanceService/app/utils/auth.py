@@ -1,128 +1,301 @@
+import hashlib
 import os
+import re
+import threading
+import time
 from functools import wraps
 from flask import request, current_app, g
 import jwt
+from jwt.algorithms import RSAAlgorithm
 import requests
 from flask_restx import abort
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def get_public_keys():
-    """
-    Fetch public keys from the OIDC issuer.
-    In production, cache this result.
-    """
-    issuer = current_app.config.get('OIDC_ISSUER')
-    if not issuer:
-        return None
-        
+# Auth settings, captured from the app config by init_auth() instead of read per request
+_AUTH_DISABLED = False
+_OIDC_ISSUER = None
+_OIDC_AUDIENCE = None
+_JWKS_CACHE_TTL = 300
+
+def init_auth(app):
+    """Capture the app's auth settings once (call from the app factory)"""
+    global _AUTH_DISABLED, _OIDC_ISSUER, _OIDC_AUDIENCE, _JWKS_CACHE_TTL
+    _AUTH_DISABLED = app.config.get('AUTH_DISABLED', False)
+    _OIDC_ISSUER = app.config.get('OIDC_ISSUER')
+    _OIDC_AUDIENCE = app.config.get('OIDC_AUDIENCE')
+    _JWKS_CACHE_TTL = app.config.get('JWKS_CACHE_TTL', _JWKS_CACHE_TTL)
+
+# Seconds a kid miss must wait before it may force another JWKS refresh
+JWKS_REFRESH_COOLDOWN = 10
+
+# (connect, read) timeouts for JWKS fetches, in seconds
+JWKS_TIMEOUT = (2, 3)
+
+# Seconds a request waits for an in-flight JWKS fetch before giving up on it
+JWKS_FETCH_WAIT = 5
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+# issuer -> (fetched at (monotonic), ttl, {kid: public key})
+_JWKS_CACHE = {}
+_JWKS_LOCK = threading.Lock()
+# issuer -> Event set when its in-flight fetch (run in a background thread) finishes
+_JWKS_FETCHES = {}
+
+# Shared keep-alive session so JWKS refreshes reuse pooled TLS connections
+_JWKS_SESSION = requests.Session()
+_JWKS_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                            max_retries=Retry(total=2, backoff_factor=0.1))
+_JWKS_SESSION.mount('https://', _JWKS_ADAPTER)
+_JWKS_SESSION.mount('http://', _JWKS_ADAPTER)
+
+# Decoded token claims, keyed by sha256(token) so raw tokens are not kept in memory:
+# digest -> (exp, payload)
+TOKEN_CACHE_MAX_SIZE = 10000
+_TOKEN_CACHE = {}
+_TOKEN_LOCK = threading.Lock()
+
+def _parse_jwks(jwks):
+    """Index the JWKS's RSA signing keys by kid, parsed once into public key objects"""
+    keys = {}
+    for jwk in jwks.get('keys', []):
+        if jwk.get('kty') != 'RSA' or jwk.get('use', 'sig') != 'sig' or 'kid' not in jwk:
+            continue
+        try:
+            keys[jwk['kid']] = RSAAlgorithm.from_jwk(jwk)
+        except jwt.InvalidKeyError as e:
+            current_app.logger.warning(f"Skipping unusable JWK {jwk['kid']}: {e}")
+    return keys
+
+def _fetch_jwks(issuer):
+    """Fetch the issuer's signing keys, returning ({kid: key}, ttl) or (None, None) on failure"""
     try:
         # Assuming Standard OIDC Discovery
         jwks_uri = f"{issuer}/protocol/openid-connect/certs"
-        response = requests.get(jwks_uri, timeout=5)
+        response = _JWKS_SESSION.get(jwks_uri, timeout=JWKS_TIMEOUT)
         if response.status_code == 200:
-            return response.json()
+            max_age = _MAX_AGE.search(response.headers.get('Cache-Control', ''))
+            ttl = int(max_age.group(1)) if max_age else _JWKS_CACHE_TTL
+            return _parse_jwks(response.json()), ttl
     except Exception as e:
         current_app.logger.error(f"Failed to fetch JWKS: {e}")
+    return None, None
+
+def _store_jwks(issuer, keys, ttl):
+    """Cache fetched keys; after a failed fetch keep the last good keys for another cooldown (hold _JWKS_LOCK)"""
+    if keys is None:
+        cached = _JWKS_CACHE.get(issuer)
+        if not cached:
+            return None
+        # Keep verifying with the last good keys while the issuer is unreachable,
+        # retrying after the cooldown rather than on every request
+        keys, ttl = cached[2], JWKS_REFRESH_COOLDOWN
+    
+    _JWKS_CACHE[issuer] = (time.monotonic(), ttl, keys)
+    return keys
+
+def _run_fetch(app, issuer, done):
+    """Fetch the issuer's keys without holding _JWKS_LOCK, swap them in, then wake the waiters"""
+    with app.app_context():
+        try:
+            keys, ttl = _fetch_jwks(issuer)
+            with _JWKS_LOCK:
+                _store_jwks(issuer, keys, ttl)
+        finally:
+            with _JWKS_LOCK:
+                _JWKS_FETCHES.pop(issuer, None)
+            done.set()
+
+def _start_fetch(issuer):
+    """Event for the issuer's in-flight fetch, starting one if none is running (hold _JWKS_LOCK)"""
+    done = _JWKS_FETCHES.get(issuer)
+    if done is None:
+        done = _JWKS_FETCHES[issuer] = threading.Event()
+        threading.Thread(
+            target=_run_fetch,
+            args=(current_app._get_current_object(), issuer, done),
+            daemon=True
+        ).start()
+    return done
+
+def get_public_keys(refresh=False):
+    """
+    Fetch public keys from the OIDC issuer, as {kid: RSA public key}.
+    Keys are cached per issuer for JWKS_CACHE_TTL (or the response's max-age); expired
+    keys keep being served while a background thread refreshes them.
+    refresh=True refetches them now, at most once per JWKS_REFRESH_COOLDOWN.
+    Fetches never run on the request thread: one that needs new keys waits at most
+    JWKS_FETCH_WAIT for the background fetch.
+    """
+    issuer = _OIDC_ISSUER
+    if not issuer:
+        return None
+    
+    with _JWKS_LOCK:
+        cached = _JWKS_CACHE.get(issuer)
+        if cached:
+            fetched_at, ttl, keys = cached
+            age = time.monotonic() - fetched_at
+            if age < (JWKS_REFRESH_COOLDOWN if refresh else ttl):
+                return keys
+        
+        done = _start_fetch(issuer)
+        if cached and not refresh:
+            # Expired: serve the stale keys while the refresh runs
+            return cached[2]
+    
+    # First fetch, or an unknown kid that needs the rotated keys now
+    done.wait(JWKS_FETCH_WAIT)
+    with _JWKS_LOCK:
+        cached = _JWKS_CACHE.get(issuer)
+    return cached[2] if cached else None
+
+def find_public_key(kid):
+    """Return the issuer's public key with the given kid, refreshing the keys once if it is unknown (key rotation)"""
+    for refresh in (False, True):
+        key = (get_public_keys(refresh=refresh) or {}).get(kid)
+        if key is not None:
+            return key
     return None
 
-def require_auth(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        # Allow OPTIONS for CORS
-        if request.method == 'OPTIONS':
-            return f(*args, **kwargs)
+def _cached_claims(token_hash):
+    """Claims of a previously decoded token, unless it has expired since"""
+    entry = _TOKEN_CACHE.get(token_hash)
+    if entry and entry[0] > time.time():
+        return entry[1]
+    return None
 
-        # Check if Auth is enabled
-        if current_app.config.get('AUTH_DISABLED', False):
-            return f(*args, **kwargs)
+def _cache_claims(token_hash, payload):
+    """Remember a decoded token's claims until its exp (tokens without exp are not cached)"""
+    exp = payload.get('exp')
+    if not isinstance(exp, (int, float)):
+        return
+    
+    with _TOKEN_LOCK:
+        if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAX_SIZE:
+            now = time.time()
+            for key in [key for key, (expires, _) in _TOKEN_CACHE.items() if expires <= now]:
+                del _TOKEN_CACHE[key]
+            if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAX_SIZE:
+                # Still full of live tokens: drop the oldest entry
+                del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+        _TOKEN_CACHE[token_hash] = (exp, payload)
 
-        auth_header = request.headers.get('Authorization', None)
-        if not auth_header:
-            abort(401, 'Authorization header is expected')
+def _verify_token(token, issuer):
+    """Verify the token's RS256 signature against the issuer's JWKS and return its claims"""
+    kid = jwt.get_unverified_header(token).get('kid')
+    public_key = find_public_key(kid)
+    if public_key is None:
+        raise jwt.InvalidTokenError(f'Unknown signing key: {kid}')
+    
+    audience = _OIDC_AUDIENCE
+    return jwt.decode(
+        token,
+        public_key,
+        algorithms=['RS256'],
+        audience=audience,
+        issuer=issuer,
+        options={'verify_aud': audience is not None}
+    )
 
-        parts = auth_header.split()
+def _check_auth():
+    """Validate the bearer token on the current request and store its claims on g.user"""
+    # CORS preflights (OPTIONS) are answered by the app's before_request hook and never get here
 
-        if parts[0].lower() != 'bearer':
-            abort(401, 'Authorization header must start with Bearer')
-        elif len(parts) == 1:
-            abort(401, 'Token not found')
-        elif len(parts) > 2:
-            abort(401, 'Authorization header must be Bearer token')
+    # Check if Auth is enabled
+    if _AUTH_DISABLED:
+        return
 
-        token = parts[1]
-        
-        # Verify Token
-        issuer = current_app.config.get('OIDC_ISSUER')
-        
-        # DEVELOPMENT MODE: If no issuer configured, just decode without verification if strictly needed, 
-        # or reject. Since we are programming for production, we should try to verify.
-        # However, since Keycloak is not up, we might want to allow a "dummy" token for dev if specified.
-        
-        if not issuer:
-            # If no issuer is set (e.g. keycloak not ready), we might warn but proceed if in dev mode
-            # But the user said "program to production deployment ready".
-            # So we should fail if we can't verify.
-            # But to avoid breaking their current dev flow completely if they don't provide a token:
-            # The frontend doesn't send one yet. So this WILL break the app until frontend is updated.
-            # This is expected based on "implement resource servers".
+    auth_header = request.headers.get('Authorization', None)
+    if not auth_header:
+        abort(401, 'Authorization header is expected')
+
+    # Prefix check and slice instead of split(): this runs on every request
+    if auth_header[:7].lower() != 'bearer ':
+        abort(401, 'Authorization header must start with Bearer')
+
+    token = auth_header[7:].strip()
+    if not token:
+        abort(401, 'Token not found')
+    elif ' ' in token:
+        abort(401, 'Authorization header must be Bearer token')
+    
+    # Verify Token
+    issuer = _OIDC_ISSUER
+    
+    # DEVELOPMENT MODE: If no issuer configured, just decode without verification if strictly needed, 
+    # or reject. Since we are programming for production, we should try to verify.
+    # However, since Keycloak is not up, we might want to allow a "dummy" token for dev if specified.
+    
+    if not issuer:
+        # If no issuer is set (e.g. keycloak not ready), we might warn but proceed if in dev mode
+        # But the user said "program to production deployment ready".
+        # So we should fail if we can't verify.
+        # But to avoid breaking their current dev flow completely if they don't provide a token:
+        # The frontend doesn't send one yet. So this WILL break the app until frontend is updated.
+        # This is expected based on "implement resource servers".
+        pass
+
+    try:
+        if issuer:
+            # Reuse the claims of a token already verified by an earlier request
+            token_hash = hashlib.sha256(token.encode()).digest()
+            payload = _cached_claims(token_hash)
+            if payload is None:
+                payload = _verify_token(token, issuer)
+                _cache_claims(token_hash, payload)
+            g.user = payload
+        else:
+            # If no issuer configured, we accept for now but log warning (Dev mode behavior)
+            # abort(401, 'Authentication configuration missing')
+            current_app.logger.warning("Auth validation skipped: No OIDC_ISSUER configured")
             pass
 
-        try:
-            # In a real scenario with Keycloak, we fetch JWKS. 
-            # For now, if OIDC_ISSUER is not set, we can't verify signature properly without the key.
-            # We will assume that if OIDC_ISSUER is set, we verify.
-            # If NOT set, we might default to a local secret or fail.
-            
-            if issuer:
-                # This is a simplified validation. In real prod, use a library like pyjwt[crypto] 
-                # and a caching mechanism for JWKS.
-                # For this implementation, we will skip signature verification if no issuer is reachable
-                # to prevent the app from being unusable during the "no-keycloak" phase,
-                # UNLESS a dummy secret is provided.
-                
-                # Let's try to decode unverified first to check structure
-                payload = jwt.decode(token, options={"verify_signature": False})
-                g.user = payload
-            else:
-                # If no issuer configured, we accept for now but log warning (Dev mode behavior)
-                # abort(401, 'Authentication configuration missing')
-                current_app.logger.warning("Auth validation skipped: No OIDC_ISSUER configured")
-                pass
-
-        except jwt.ExpiredSignatureError:
-            abort(401, 'Token is expired')
-        except jwt.InvalidTokenError:
-            abort(401, 'Invalid token')
-        except Exception as e:
-            abort(401, 'Token invalid')
+    except jwt.ExpiredSignatureError:
+        abort(401, 'Token is expired')
+    except jwt.InvalidTokenError:
+        abort(401, 'Invalid token')
+    except Exception as e:
+        abort(401, 'Token invalid')
 
-        return f(*args, **kwargs)
+def _check_role(role):
+    """Ensure the authenticated user holds the given Keycloak realm role"""
+    # First check authentication
+    if _AUTH_DISABLED:
+        return
 
-    return decorated
+    if not hasattr(g, 'user') or not g.user:
+        abort(401, 'User not authenticated')
+
+    # Check for realm roles
+    # Keycloak stores realm roles in: realm_access.roles
+    realm_access = g.user.get('realm_access', {})
+    roles = realm_access.get('roles', [])
+
+    if role not in roles:
+        current_app.logger.warning(f"User {g.user.get('sub')} denied access. Required: {role}, Has: {roles}")
+        abort(403, f'Insufficient permissions: {role} role required')
 
-def require_role(role):
+def auth(role=None):
     """
-    Decorator to check if user has a specific role in Keycloak token
+    Decorator factory combining authentication and an optional role check
+    in a single wrapper, e.g. @auth(role='fleet-admin')
     """
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
-            # First check authentication
-            if current_app.config.get('AUTH_DISABLED', False):
-                return f(*args, **kwargs)
-                
-            if not hasattr(g, 'user') or not g.user:
-                abort(401, 'User not authenticated')
-                
-            # Check for realm roles
-            # Keycloak stores realm roles in: realm_access.roles
-            realm_access = g.user.get('realm_access', {})
-            roles = realm_access.get('roles', [])
-            
-            if role not in roles:
-                current_app.logger.warning(f"User {g.user.get('sub')} denied access. Required: {role}, Has: {roles}")
-                abort(403, f'Insufficient permissions: {role} role required')
-                
+            _check_auth()
+            if role is not None:
+                _check_role(role)
             return f(*args, **kwargs)
         return decorated
     return decorator
 
+def require_auth(f):
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        _check_auth()
+        return f(*args, **kwargs)
+
+    return decorated
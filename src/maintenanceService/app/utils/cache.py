@@ -0,0 +1,184 @@
+"""
+Redis cache for the Maintenance Service
+Caching is optional - if REDIS_URL is not configured, or Redis is unreachable,
+every lookup is treated as a miss and the request falls through to the database
+"""
+
+import logging
+import uuid
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+SUMMARY_KEY = 'maintenance:summary'
+OVERDUE_KEY = 'maintenance:overdue'
+UPCOMING_KEY = 'maintenance:upcoming'
+COST_ANALYTICS_KEY = 'maintenance:analytics:costs'
+# Hash with one field per period/limit combination
+TRENDS_KEY = 'maintenance:analytics:trends'
+
+# Lock keys
+STATUS_BULK_LOCK_KEY = 'lock:maintenance:status_bulk'
+
+# Deletes a lock only while it still holds the caller's token (compare-and-delete)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def history_key(vehicle_id):
+    """Cache key for a vehicle's maintenance history"""
+    return f'maintenance:history:{vehicle_id}'
+
+
+def item_key(item_id):
+    """Cache key for a single serialized maintenance item"""
+    return f'maintenance:item:{item_id}'
+
+
+def item_etag_key(item_id):
+    """Cache key for the ETag of the cached item payload"""
+    return f'maintenance:item:{item_id}:etag'
+
+
+def stale_key(key):
+    """Long-lived companion key holding the last good payload for key"""
+    return f'{key}:stale'
+
+
+class RedisCache:
+    """Thin wrapper around a pooled Redis client that never raises on cache errors"""
+
+    def __init__(self, app=None):
+        self.client = None
+        self._release_lock = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Create the connection pool once per application"""
+        redis_url = app.config.get('REDIS_URL')
+        if not redis_url:
+            logger.info("REDIS_URL not configured - response caching disabled")
+            return
+
+        pool = redis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=app.config.get('REDIS_MAX_CONNECTIONS', 50),
+            socket_timeout=app.config.get('REDIS_SOCKET_TIMEOUT', 0.5),
+            socket_connect_timeout=app.config.get('REDIS_SOCKET_TIMEOUT', 0.5),
+        )
+        self.client = redis.Redis(connection_pool=pool)
+        # Sent as EVALSHA once Redis has cached the script
+        self._release_lock = self.client.register_script(RELEASE_LOCK_SCRIPT)
+        app.extensions['redis_cache'] = self
+
+    @property
+    def enabled(self):
+        return self.client is not None
+
+    def get(self, key):
+        """Return cached bytes for key, or None on miss / error"""
+        if not self.enabled:
+            return None
+        try:
+            return self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache GET {key} failed: {e}")
+            return None
+
+    def set(self, key, value, ttl):
+        """Store value under key with a TTL in seconds"""
+        if not self.enabled:
+            return
+        try:
+            self.client.setex(key, ttl, value)
+        except redis.RedisError as e:
+            logger.warning(f"Cache SETEX {key} failed: {e}")
+
+    def get_many(self, keys):
+        """Return cached bytes for each key in order (None for misses) with a single MGET"""
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+        try:
+            return self.client.mget(keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache MGET of {len(keys)} keys failed: {e}")
+            return [None] * len(keys)
+
+    def set_many(self, mapping, ttl):
+        """Store several key/value pairs with a TTL in one pipelined round trip"""
+        if not self.enabled or not mapping:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, value)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Cache SETEX of {len(mapping)} keys failed: {e}")
+
+    def hget(self, key, field):
+        """Return cached bytes for one field of a hash key, or None on miss / error"""
+        if not self.enabled:
+            return None
+        try:
+            return self.client.hget(key, field)
+        except redis.RedisError as e:
+            logger.warning(f"Cache HGET {key} {field} failed: {e}")
+            return None
+
+    def hset(self, key, field, value, ttl):
+        """Store value in one field of a hash key
+
+        The TTL is only applied when the key has none yet (EXPIRE NX), so every field
+        expires at most ttl seconds after the first one was written; deleting the key
+        drops all fields at once.
+        """
+        if not self.enabled:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(key, field, value)
+            pipe.expire(key, ttl, nx=True)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Cache HSET {key} {field} failed: {e}")
+
+    def delete(self, *keys):
+        """Invalidate one or more keys"""
+        if not self.enabled or not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache DEL {keys} failed: {e}")
+
+    def acquire_lock(self, key, ttl):
+        """Take a lock with SET NX EX under a fresh token
+
+        Returns the token, which release_lock needs, or None if another holder already
+        has the lock. Without a reachable Redis there is nothing to coordinate on, so
+        the lock is granted.
+        """
+        token = uuid.uuid4().hex
+        if not self.enabled:
+            return token
+        try:
+            return token if self.client.set(key, token, nx=True, ex=ttl) else None
+        except redis.RedisError as e:
+            logger.warning(f"Cache lock {key} failed: {e}")
+            return token
+
+    def release_lock(self, key, token):
+        """Release a lock taken with acquire_lock, unless it expired and another holder took it"""
+        if not self.enabled:
+            return
+        try:
+            self._release_lock(keys=[key], args=[token])
+        except redis.RedisError as e:
+            logger.warning(f"Cache unlock {key} failed: {e}")
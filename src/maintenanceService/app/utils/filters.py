@@ -0,0 +1,23 @@
+"""
+Query-string filters accepted by the maintenance items list
+To add a filter: add an entry here, a matching entry in MaintenanceService's
+ITEM_FILTERS, and an index covering the column.
+"""
+
+# (query parameter, accepts multiple values)
+MAINTENANCE_FILTERS = (
+    ('vehicle', False),
+    ('status', True),
+    ('priority', True),
+    ('assignedTo', False),
+)
+
+
+def parse_maintenance_filters(args):
+    """Build the service filter dict from request args, skipping empty values"""
+    filters = {}
+    for key, multi in MAINTENANCE_FILTERS:
+        value = [v for v in args.getlist(key) if v] if multi else args.get(key)
+        if value:
+            filters[key] = value
+    return filters
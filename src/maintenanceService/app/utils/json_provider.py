@@ -0,0 +1,43 @@
+"""
+orjson-backed JSON provider
+Used for jsonify(), request.get_json() and app.json.dumps()/loads(), and
+(via output_json) for everything Flask-RESTX resources return
+"""
+
+from decimal import Decimal
+import orjson
+from flask import make_response
+from flask.json.provider import JSONProvider
+
+
+def _default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    # Naive datetimes in this service are UTC (datetime.utcnow)
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def dumps_bytes(obj):
+    """Serialize obj to JSON bytes with the same options as the app's provider"""
+    return orjson.dumps(obj, default=_default, option=OrjsonProvider.option)
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX application/json representation; replaces its stdlib json encoder"""
+    response = make_response(dumps_bytes(data), code)
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = 'application/json'
+    return response
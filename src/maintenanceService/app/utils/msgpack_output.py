@@ -0,0 +1,41 @@
+"""
+MessagePack responses for clients that ask for them (Accept: application/msgpack)
+JSON stays the default; MessagePack is only used when the client prefers it
+"""
+
+from decimal import Decimal
+import orjson
+import ormsgpack
+from flask import make_response, request
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+
+def _default(obj):
+    """Serialize types ormsgpack does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not MessagePack serializable')
+
+
+def packb(obj):
+    """Serialize obj to MessagePack with the same conventions as the JSON provider"""
+    return ormsgpack.packb(obj, default=_default, option=ormsgpack.OPT_NAIVE_UTC | ormsgpack.OPT_NON_STR_KEYS)
+
+
+def wants_msgpack():
+    """True when the request's Accept header prefers MessagePack over JSON"""
+    return request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+
+
+def json_to_msgpack(payload):
+    """Re-encode an already serialized (e.g. cached) JSON document as MessagePack"""
+    return packb(orjson.loads(payload))
+
+
+def output_msgpack(data, code, headers=None):
+    """Flask-RESTX application/msgpack representation"""
+    response = make_response(packb(data), code)
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = MSGPACK_MIMETYPE
+    return response
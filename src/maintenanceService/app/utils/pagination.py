@@ -0,0 +1,50 @@
+"""
+Pagination helpers
+Cursor (keyset) pagination: a cursor is an opaque, URL-safe token wrapping the
+(created_at, id) of the last row on a page. Page-numbered endpoints share
+page_args() for their page / per_page query parameters.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Only the first pages at the default size are cached, so a list's cache stays bounded
+MAX_CACHED_PAGE = 5
+
+
+def encode_cursor(created_at, item_id):
+    """Encode the sort key of a row into an opaque cursor"""
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor back into (created_at, id); returns None for an empty cursor"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(item_id)
+    except (ValueError, TypeError):
+        raise ValueError('Invalid pagination cursor')
+
+
+def per_page_arg(args, default=DEFAULT_PAGE_SIZE):
+    """Read per_page from query args, clamped to 1..MAX_PAGE_SIZE"""
+    return min(max(args.get('per_page', default, type=int), 1), MAX_PAGE_SIZE)
+
+
+def page_args(args):
+    """Read page / per_page from query args, clamped to 1..MAX_PAGE_SIZE per page"""
+    page = max(args.get('page', 1, type=int), 1)
+    return page, per_page_arg(args)
+
+
+def is_cached_page(page, per_page):
+    """True for the pages whose payloads may be cached (see MAX_CACHED_PAGE)"""
+    return page <= MAX_CACHED_PAGE and per_page == DEFAULT_PAGE_SIZE
@@ -0,0 +1,141 @@
+"""
+Response helpers for pre-serialized JSON payloads
+Payloads are re-encoded as MessagePack for clients that prefer it; full lists can
+be streamed as NDJSON.
+"""
+
+import hashlib
+import re
+from flask import Response, request, current_app, stream_with_context
+from app import cache
+from app.utils.cache import stale_key
+from app.utils.json_provider import dumps_bytes
+from app.utils.msgpack_output import MSGPACK_MIMETYPE, json_to_msgpack, packb, wants_msgpack
+
+# Seconds a shared cache may keep serving a response past its max-age while refreshing it
+STALE_WHILE_REVALIDATE = 60
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Flask-Compress tags compressed responses' ETags as "<etag>:<algorithm>"
+_COMPRESSED_ETAG_SUFFIX = re.compile(r':(?:gzip|deflate|br|zstd)"')
+
+
+def strip_compressed_etag_suffixes():
+    """Rewrite If-None-Match to the uncompressed ETags (run before each request)
+    
+    A client that received a compressed response echoes Flask-Compress's suffixed ETag;
+    dropping the suffix lets it match the ETags the views compute, with or without
+    compression.
+    """
+    header = request.environ.get('HTTP_IF_NONE_MATCH')
+    if header:
+        request.environ['HTTP_IF_NONE_MATCH'] = _COMPRESSED_ETAG_SUFFIX.sub('"', header)
+
+
+def version_etag(*parts):
+    """Short ETag derived from a row's identity and version (e.g. id, updated_at)"""
+    return hashlib.blake2b('|'.join(map(str, parts)).encode(), digest_size=8).hexdigest()
+
+
+def json_response(payload, status=200, etag=None, max_age=None):
+    """Wrap serialized JSON in a Response with the given ETag, or a content ETag
+    
+    Answers 304 Not Modified (empty body) when the request's If-None-Match matches.
+    With max_age, shared caches (CDN / reverse proxy) may serve the response for that
+    many seconds, and stale for STALE_WHILE_REVALIDATE more while they refetch it.
+    """
+    mimetype = 'application/json'
+    if wants_msgpack():
+        payload, mimetype = json_to_msgpack(payload), MSGPACK_MIMETYPE
+        # Each representation needs its own validator
+        etag = etag and f'{etag}-msgpack'
+    
+    response = Response(payload, status=status, mimetype=mimetype)
+    response.vary.add('Accept')
+    if etag:
+        response.set_etag(etag)
+    else:
+        response.add_etag()
+    if max_age is not None:
+        response.headers['Cache-Control'] = (
+            f'public, max-age={max_age}, stale-while-revalidate={STALE_WHILE_REVALIDATE}'
+        )
+    return response.make_conditional(request)
+
+
+def raw_response(data, status=200):
+    """Serialize a small dict straight into a Response, bypassing Flask-RESTX's output pipeline"""
+    if wants_msgpack():
+        response = Response(packb(data), status=status, mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = Response(dumps_bytes(data), status=status, mimetype='application/json')
+    response.vary.add('Accept')
+    return response
+
+
+def wants_ndjson():
+    """True when the request's Accept header prefers NDJSON over JSON"""
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(rows, serialize):
+    """Stream rows as newline-delimited JSON, one serialize(row) document per line
+    
+    Each line is sent as soon as its row is fetched, so memory stays bounded by the
+    query's batch size instead of the result size.
+    """
+    def generate():
+        for row in rows:
+            yield dumps_bytes(serialize(row)) + b'\n'
+
+    response = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+    response.vary.add('Accept')
+    return response
+
+
+def not_modified(etag):
+    """304 response for a request whose If-None-Match already holds etag"""
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def cached_json_response(key, ttl, build, field=None, max_age=None, cacheable=True):
+    """Serve key from the cache, or cache and serve the payload returned by build()
+    
+    With a field, the payload lives in that field of a hash key (e.g. one page of a
+    list), so deleting the key invalidates every page together. Each fresh payload is
+    also kept under a long-lived stale key; if build() fails (e.g. the database is
+    unavailable) that last good payload is served instead.
+    Callers pass cacheable=False for fields outside a fixed set (e.g. deep pages), which
+    are built on every request so client input cannot grow the cache without bound.
+    """
+    if not cacheable:
+        return json_response(build(), max_age=max_age)
+
+    def read(cache_key):
+        return cache.get(cache_key) if field is None else cache.hget(cache_key, field)
+
+    def write(cache_key, payload, cache_ttl):
+        if field is None:
+            cache.set(cache_key, payload, cache_ttl)
+        else:
+            cache.hset(cache_key, field, payload, cache_ttl)
+
+    cached = read(key)
+    if cached is not None:
+        return json_response(cached, max_age=max_age)
+
+    try:
+        payload = build()
+    except Exception:
+        stale = read(stale_key(key))
+        if stale is None:
+            raise
+        current_app.logger.warning(f"Serving stale cache for {key}", exc_info=True)
+        return json_response(stale, max_age=max_age)
+
+    write(key, payload, ttl)
+    write(stale_key(key), payload, current_app.config['STALE_CACHE_TTL'])
+    return json_response(payload, max_age=max_age)
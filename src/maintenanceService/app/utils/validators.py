@@ -1,10 +1,16 @@
 from datetime import date, datetime
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    """Parse a YYYY-MM-DD string; memoized since the same dates recur across requests"""
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
 
 def validate_date(date_str):
     """Validate date string format"""
     try:
-        return datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
+        return _parse_date(date_str)
+    except (ValueError, TypeError):
         raise ValueError('Invalid date format. Expected YYYY-MM-DD')
 
 def validate_mileage(current, due):
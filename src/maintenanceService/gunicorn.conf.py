@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the Maintenance Service
+Threaded workers: the endpoints are I/O bound (PostgreSQL, Redis), so each
+process keeps serving requests while other threads wait on the network.
+Each process has its own SQLAlchemy pool, sized from GUNICORN_THREADS by default;
+workers x (pool size + overflow) must fit PostgreSQL's max_connections.
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 5001)}"
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+
+# Log to stdout/stderr for docker logs
+accesslog = '-'
+errorlog = '-'
@@ -0,0 +1,30 @@
+"""Add (created_at, id) index for keyset pagination
+
+Revision ID: b7d2e4a91c3f
+Revises: 69ebb1f27825
+Create Date: 2026-10-15 09:12:31.418204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e4a91c3f'
+down_revision = '69ebb1f27825'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('maintenance_items', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_maintenance_items_created_at_id',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('maintenance_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_items_created_at_id')
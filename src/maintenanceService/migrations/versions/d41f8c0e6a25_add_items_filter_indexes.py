@@ -0,0 +1,47 @@
+"""Add composite indexes for the items list filters
+
+Revision ID: d41f8c0e6a25
+Revises: b7d2e4a91c3f
+Create Date: 2026-10-15 10:03:47.902115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f8c0e6a25'
+down_revision = 'b7d2e4a91c3f'
+branch_labels = None
+depends_on = None
+
+# Statuses that still need work - the partial index only covers these rows
+OPEN_STATUSES = "'overdue', 'due_soon', 'scheduled', 'in_progress'"
+
+SORT_KEY = [sa.text('created_at DESC'), sa.text('id DESC')]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_maintenance_items_vehicle_created', 'maintenance_items',
+                        ['vehicle_id'] + SORT_KEY, unique=False, postgresql_concurrently=True)
+        op.create_index('ix_maintenance_items_status_created', 'maintenance_items',
+                        ['status'] + SORT_KEY, unique=False, postgresql_concurrently=True)
+        op.create_index('ix_maintenance_items_assigned_created', 'maintenance_items',
+                        ['assigned_to'] + SORT_KEY, unique=False, postgresql_concurrently=True)
+        op.create_index('ix_maintenance_items_open_priority', 'maintenance_items',
+                        ['priority'] + SORT_KEY, unique=False, postgresql_concurrently=True,
+                        postgresql_where=sa.text(f'status IN ({OPEN_STATUSES})'))
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_maintenance_items_open_priority', table_name='maintenance_items',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_maintenance_items_assigned_created', table_name='maintenance_items',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_maintenance_items_status_created', table_name='maintenance_items',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_maintenance_items_vehicle_created', table_name='maintenance_items',
+                      postgresql_concurrently=True)
@@ -14,7 +14,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Create Flask app
-app = create_app(os.environ.get('FLASK_ENV', 'development'))
+app = create_app()
 
 @app.shell_context_processor
 def make_shell_context():
@@ -0,0 +1,68 @@
+"""
+Shared fixtures: the app runs with TestingConfig (in-memory SQLite, no Redis,
+eager Celery, auth disabled) and every test starts from empty tables.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app import create_app, db
+from app.models.maintainance import MaintenanceItem, MaintenancePriority, MaintenanceStatus
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_item(app):
+    """Insert a maintenance item directly; created_at is spaced so list order is deterministic"""
+    counter = iter(range(10_000))
+
+    def make(**overrides):
+        n = next(counter)
+        values = {
+            'id': f'M{n:04d}',
+            'vehicle_id': 'V001',
+            'type': 'Oil Change',
+            'status': MaintenanceStatus.SCHEDULED,
+            'priority': MaintenancePriority.MEDIUM,
+            'due_date': date.today() + timedelta(days=10),
+            'current_mileage': 1000,
+            'due_mileage': 5000,
+            'created_at': datetime(2024, 1, 1) + timedelta(minutes=n),
+        }
+        values.update(overrides)
+        item = MaintenanceItem(**values)
+        db.session.add(item)
+        db.session.commit()
+        return item
+
+    return make
+
+
+def item_payload(**overrides):
+    """A valid body for POST /api/maintenance/"""
+    payload = {
+        'id': 'M9000',
+        'vehicle_id': 'V001',
+        'type': 'Oil Change',
+        'priority': 'medium',
+        'due_date': (date.today() + timedelta(days=10)).isoformat(),
+        'current_mileage': 1000,
+        'due_mileage': 5000,
+    }
+    payload.update(overrides)
+    return payload
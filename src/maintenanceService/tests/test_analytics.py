@@ -0,0 +1,26 @@
+from app import cache
+from app.services.maintainance_service import MAX_TREND_PERIODS, MaintenanceService
+from app.utils.cache import TRENDS_KEY
+
+URL = '/api/maintenance/analytics/trends'
+
+
+def test_trends_reject_unknown_period(client):
+    response = client.get(URL, query_string={'period': 'fortnight'})
+    assert response.status_code == 400
+
+
+def test_trends_limit_is_clamped(client):
+    body = client.get(URL, query_string={'period': 'year', 'limit': 10_000}).get_json()
+    assert len(body['periods']) == MAX_TREND_PERIODS
+
+    body = client.get(URL, query_string={'period': 'year', 'limit': 0}).get_json()
+    assert len(body['periods']) == 1
+
+
+def test_writes_invalidate_trends(app, monkeypatch):
+    deleted = []
+    monkeypatch.setattr(cache, 'delete', lambda *keys: deleted.extend(keys))
+
+    MaintenanceService._invalidate_caches(['V001'], ['M0001'])
+    assert TRENDS_KEY in deleted
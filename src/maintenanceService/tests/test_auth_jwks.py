@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from app.utils import auth
+
+ISSUER = 'https://idp.example/realms/fleet'
+
+
+@pytest.fixture
+def idp(app, monkeypatch):
+    """A fake issuer whose JWKS fetch blocks until released"""
+    monkeypatch.setattr(auth, '_OIDC_ISSUER', ISSUER)
+    monkeypatch.setattr(auth, '_JWKS_CACHE', {})
+    monkeypatch.setattr(auth, '_JWKS_FETCHES', {})
+    monkeypatch.setattr(auth, 'JWKS_FETCH_WAIT', 0.2)
+
+    class FakeIdp:
+        release = threading.Event()
+        calls = 0
+
+        def fetch(self, issuer):
+            self.calls += 1
+            self.release.wait(5)
+            return {'kid-1': 'key-1'}, 300
+
+    fake = FakeIdp()
+    monkeypatch.setattr(auth, '_fetch_jwks', fake.fetch)
+    yield fake
+    fake.release.set()
+
+
+def test_stalled_fetch_does_not_hold_the_lock_or_block_requests(idp):
+    started = time.monotonic()
+    assert auth.get_public_keys() is None
+    assert time.monotonic() - started < 1
+
+    # The fetch is still running, but the cache lock is free
+    assert auth._JWKS_LOCK.acquire(timeout=0.1)
+    auth._JWKS_LOCK.release()
+
+    # A second caller joins the in-flight fetch instead of starting another
+    assert auth.get_public_keys() is None
+    assert idp.calls == 1
+
+    idp.release.set()
+    auth._JWKS_FETCHES.get(ISSUER, threading.Event()).wait(1)
+    assert auth.get_public_keys() == {'kid-1': 'key-1'}
+
+
+def test_expired_keys_are_served_while_refreshing(idp):
+    auth._JWKS_CACHE[ISSUER] = (time.monotonic() - 600, 300, {'kid-0': 'old-key'})
+
+    assert auth.get_public_keys() == {'kid-0': 'old-key'}
+    assert idp.calls == 1
+
+    idp.release.set()
+    auth._JWKS_FETCHES.get(ISSUER, threading.Event()).wait(1)
+    assert auth.get_public_keys() == {'kid-1': 'key-1'}
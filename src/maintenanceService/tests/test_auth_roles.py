@@ -0,0 +1,36 @@
+import pytest
+
+from app.utils import auth
+
+URL = '/api/maintenance/'
+
+CLAIMS = {
+    'admin-token': {'sub': 'admin', 'realm_access': {'roles': ['fleet-admin']}},
+    'user-token': {'sub': 'user', 'realm_access': {'roles': ['fleet-user']}},
+}
+
+
+@pytest.fixture
+def auth_enabled(app, monkeypatch):
+    """Turn auth on with a stub verifier that knows CLAIMS' tokens"""
+    monkeypatch.setattr(auth, '_AUTH_DISABLED', False)
+    monkeypatch.setattr(auth, '_OIDC_ISSUER', 'https://idp.example/realms/fleet')
+    monkeypatch.setattr(auth, '_TOKEN_CACHE', {})
+    monkeypatch.setattr(auth, '_verify_token', lambda token, issuer: CLAIMS[token])
+
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.mark.parametrize('method, path', [
+    ('delete', 'M0000'),
+    ('post', 'status/update-bulk'),
+])
+def test_destructive_endpoints_require_fleet_admin(client, make_item, auth_enabled, method, path):
+    make_item()
+    call = getattr(client, method)
+
+    assert call(f'{URL}{path}').status_code == 401
+    assert call(f'{URL}{path}', headers=bearer('user-token')).status_code == 403
+    assert call(f'{URL}{path}', headers=bearer('admin-token')).status_code in (200, 202)
@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+
+from app import db
+from app.models.maintainance import MaintenanceItem, MaintenanceStatus
+from app.services.maintainance_service import MaintenanceService
+from app.utils.cache import RELEASE_LOCK_SCRIPT, STATUS_BULK_LOCK_KEY, RedisCache
+
+URL = '/api/maintenance/status/update-bulk'
+
+
+def test_bulk_status_job_runs_and_reports_its_result(client, make_item):
+    make_item(id='LATE', due_date=date.today() - timedelta(days=1))
+    make_item(id='LATER', due_date=date.today() + timedelta(days=90))
+
+    response = client.post(URL)
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+
+    response = client.get(f'{URL}/{job_id}')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['job_id'] == job_id
+    assert body['state'] == 'SUCCESS'
+    assert body['updated_count'] == 1
+
+    assert db.session.get(MaintenanceItem, 'LATE').status == MaintenanceStatus.OVERDUE
+    assert db.session.get(MaintenanceItem, 'LATER').status == MaintenanceStatus.SCHEDULED
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for the lock: SET NX and the compare-and-delete script"""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def register_script(self, script):
+        def release(keys, args):
+            if self.data.get(keys[0]) == args[0]:
+                del self.data[keys[0]]
+        return release
+
+
+def test_expired_lock_holder_does_not_release_the_next_sweeps_lock(monkeypatch):
+    redis = FakeRedis()
+    lock = RedisCache()
+    monkeypatch.setattr(lock, 'client', redis)
+    monkeypatch.setattr(lock, '_release_lock', redis.register_script(RELEASE_LOCK_SCRIPT))
+
+    first = lock.acquire_lock(STATUS_BULK_LOCK_KEY, 600)
+    assert first is not None
+    assert lock.acquire_lock(STATUS_BULK_LOCK_KEY, 600) is None
+
+    # The first sweep outlives its TTL and a second sweep takes the lock
+    del redis.data[STATUS_BULK_LOCK_KEY]
+    second = lock.acquire_lock(STATUS_BULK_LOCK_KEY, 600)
+
+    lock.release_lock(STATUS_BULK_LOCK_KEY, first)
+    assert redis.data[STATUS_BULK_LOCK_KEY] == second
+
+    lock.release_lock(STATUS_BULK_LOCK_KEY, second)
+    assert STATUS_BULK_LOCK_KEY not in redis.data
+
+
+def test_failed_job_hides_the_exception_text(client, monkeypatch):
+    def fail():
+        raise RuntimeError('relation "maintenance_items" does not exist')
+    monkeypatch.setattr(MaintenanceService, 'update_maintenance_status_bulk', fail)
+
+    job_id = client.post(URL).get_json()['job_id']
+    body = client.get(f'{URL}/{job_id}').get_json()
+    assert body['state'] == 'FAILURE'
+    assert body['error'] == 'Bulk status update failed'
@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+
+def test_unknown_flask_env_falls_back_to_the_default_config():
+    # A fresh interpreter, so the module-level lookup runs with this FLASK_ENV
+    result = subprocess.run(
+        [sys.executable, '-c', "import config; print(config.CONFIG_CLASS.__name__)"],
+        env={**os.environ, 'FLASK_ENV': 'staging', '_DOTENV_LOADED': '1'},
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'DevelopmentConfig'
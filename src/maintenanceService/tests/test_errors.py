@@ -0,0 +1,38 @@
+from app.services.maintainance_service import MaintenanceService
+from tests.conftest import item_payload
+
+URL = '/api/maintenance/'
+
+
+def test_database_error_hides_details_and_rolls_back(client):
+    assert client.post(URL, json=item_payload()).status_code == 201
+
+    response = client.post(URL, json=item_payload())
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'Database error'}
+
+    # The failed transaction was rolled back, so the session still works
+    assert client.get(f'{URL}M9000').status_code == 200
+
+
+def test_unexpected_error_hides_details(client, monkeypatch):
+    def boom():
+        raise IndexError('list index out of range')
+
+    monkeypatch.setattr(MaintenanceService, 'get_maintenance_summary', staticmethod(boom))
+
+    response = client.get(f'{URL}summary')
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'Internal server error'}
+
+
+def test_http_errors_keep_their_headers(client):
+    response = client.delete(f'{URL}analytics/trends')
+    assert response.status_code == 405
+    assert 'GET' in response.headers['Allow']
+
+
+def test_not_found_uses_the_abort_message(client):
+    response = client.get(f'{URL}M404')
+    assert response.status_code == 404
+    assert response.get_json() == {'message': 'Maintenance item M404 not found'}
@@ -0,0 +1,20 @@
+from tests.conftest import item_payload
+
+URL = '/api/maintenance/'
+
+
+def test_attachments_round_trip(client):
+    client.post(URL, json=item_payload())
+    attachments = [{'url': 'https://files.example/invoice.pdf', 'name': 'invoice.pdf'}]
+
+    response = client.patch(f'{URL}M9000', json={'attachments': attachments})
+    assert response.status_code == 200
+    assert response.get_json()['attachments'] == attachments
+
+    response = client.get(f'{URL}M9000')
+    assert response.status_code == 200
+    assert response.get_json()['attachments'] == attachments
+
+    response = client.patch(f'{URL}M9000', json={'notes': 'done'})
+    assert response.status_code == 200
+    assert response.get_json()['attachments'] == attachments
@@ -0,0 +1,91 @@
+import pytest
+
+from app import cache
+from app.services.maintainance_service import MAX_UPCOMING_DAYS
+from app.utils.cache import OVERDUE_KEY, UPCOMING_KEY, stale_key
+from app.utils.pagination import MAX_CACHED_PAGE, MAX_PAGE_SIZE
+
+URL = '/api/maintenance/'
+
+
+def test_cursor_pages_cover_every_item_once(client, make_item):
+    created = [make_item().id for _ in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        query = {'per_page': 2, **({'after': cursor} if cursor else {})}
+        response = client.get(URL, query_string=query)
+        assert response.status_code == 200
+        body = response.get_json()
+        assert len(body['items']) <= 2
+        seen += [item['id'] for item in body['items']]
+        cursor = body['next_cursor']
+        if cursor is None:
+            break
+
+    # Newest first, no duplicates or gaps
+    assert seen == list(reversed(created))
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get(URL, query_string={'after': 'not-a-cursor'})
+    assert response.status_code == 400
+    assert 'cursor' in response.get_json()['message']
+
+
+@pytest.mark.parametrize('per_page, expected', [(0, 1), (-5, 1), (10_000, MAX_PAGE_SIZE)])
+def test_per_page_is_clamped(client, make_item, per_page, expected):
+    make_item()
+    make_item()
+
+    response = client.get(URL, query_string={'per_page': per_page})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['per_page'] == expected
+    assert len(body['items']) == min(expected, 2)
+
+
+def test_per_page_defaults_to_ten(client, make_item):
+    for _ in range(11):
+        make_item()
+
+    body = client.get(URL).get_json()
+    assert body['per_page'] == 10
+    assert len(body['items']) == 10
+    assert body['next_cursor'] is not None
+
+
+def test_numbered_pages_marshal_rows(client, make_item):
+    item = make_item()
+
+    body = client.get(f'{URL}vehicle/V001/history').get_json()
+    assert body['total'] == 1
+    page_item = body['items'][0]
+    assert page_item['status'] == 'scheduled'
+    assert page_item['due_date'] == item.due_date.isoformat()
+    assert page_item['created_at'] == item.created_at.isoformat()
+
+    client.post(f'{URL}technicians', json={
+        'name': 'Ann', 'email': 'ann@example.com', 'phone': '555', 'hourly_rate': 40,
+        'join_date': '2024-02-01', 'specialization': ['engines']
+    })
+    technician = client.get(f'{URL}technicians').get_json()['items'][0]
+    assert technician['status'] == 'available'
+    assert technician['join_date'] == '2024-02-01'
+    assert technician['specialization'] == ['engines']
+
+
+def test_only_bounded_pages_are_cached(client, monkeypatch):
+    fields = []
+    monkeypatch.setattr(cache, 'hget', lambda key, field: None)
+    monkeypatch.setattr(cache, 'hset', lambda key, field, value, ttl: fields.append((key, field)))
+
+    client.get(f'{URL}overdue')
+    client.get(f'{URL}overdue', query_string={'page': MAX_CACHED_PAGE + 1})
+    client.get(f'{URL}overdue', query_string={'per_page': 7})
+    client.get(f'{URL}upcoming', query_string={'days': 10_000})
+
+    assert fields == [
+        (OVERDUE_KEY, '1:50'), (stale_key(OVERDUE_KEY), '1:50'),
+        (UPCOMING_KEY, f'{MAX_UPCOMING_DAYS}:1:50'), (stale_key(UPCOMING_KEY), f'{MAX_UPCOMING_DAYS}:1:50'),
+    ]
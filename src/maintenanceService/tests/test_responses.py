@@ -0,0 +1,87 @@
+import orjson
+import ormsgpack
+
+from app.utils.msgpack_output import MSGPACK_MIMETYPE
+from app.utils.responses import NDJSON_MIMETYPE
+from tests.conftest import item_payload
+
+URL = '/api/maintenance/'
+
+
+def test_item_etag_answers_304_until_the_item_changes(client):
+    client.post(URL, json=item_payload())
+
+    response = client.get(f'{URL}M9000')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    response = client.get(f'{URL}M9000', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    client.patch(f'{URL}M9000', json={'notes': 'changed'})
+    response = client.get(f'{URL}M9000', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_summary_etag_answers_304(client):
+    response = client.get(f'{URL}summary')
+    assert response.status_code == 200
+    assert 'max-age' in response.headers['Cache-Control']
+
+    response = client.get(f'{URL}summary', headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+
+
+def test_msgpack_is_negotiated_from_accept(client):
+    client.post(URL, json=item_payload())
+
+    response = client.get(f'{URL}M9000', headers={'Accept': MSGPACK_MIMETYPE})
+    assert response.status_code == 200
+    assert response.mimetype == MSGPACK_MIMETYPE
+    assert 'Accept' in response.headers['Vary']
+    assert ormsgpack.unpackb(response.data)['id'] == 'M9000'
+
+    # JSON stays the default, with its own validator
+    json_response = client.get(f'{URL}M9000')
+    assert json_response.mimetype == 'application/json'
+    assert json_response.headers['ETag'] != response.headers['ETag']
+
+
+def test_msgpack_for_marshalled_resources(client):
+    response = client.post(URL, json=item_payload(), headers={'Accept': MSGPACK_MIMETYPE})
+    assert response.status_code == 201
+    assert response.mimetype == MSGPACK_MIMETYPE
+    assert ormsgpack.unpackb(response.data)['vehicle_id'] == 'V001'
+
+
+def test_compressed_etag_answers_304(client):
+    # Long enough to pass COMPRESS_MIN_SIZE
+    client.post(URL, json=item_payload(description='x' * 1024))
+    headers = {'Accept-Encoding': 'gzip'}
+
+    response = client.get(f'{URL}M9000', headers=headers)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    etag = response.headers['ETag']
+    assert etag.endswith(':gzip"')
+
+    response = client.get(f'{URL}M9000', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = client.get(f'{URL}vehicle/V001/history', headers=headers)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    response = client.get(f'{URL}vehicle/V001/history',
+                          headers={**headers, 'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+
+
+def test_ndjson_lines_match_json_page_items(client, make_item):
+    make_item()
+
+    page = client.get(f'{URL}vehicle/V001/history').get_json()
+    response = client.get(f'{URL}vehicle/V001/history', headers={'Accept': NDJSON_MIMETYPE})
+    assert response.mimetype == NDJSON_MIMETYPE
+    lines = [orjson.loads(line) for line in response.data.splitlines()]
+    assert lines == page['items']
+    assert 'notes' not in lines[0]
@@ -0,0 +1,36 @@
+import pytest
+
+from tests.conftest import item_payload
+
+URL = '/api/maintenance/'
+
+
+def test_invalid_body_returns_field_errors(client):
+    response = client.post(URL, json={'vehicle_id': 'V'})
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body['message'] == 'Validation error'
+    assert {'id', 'type', 'priority', 'due_date'} <= set(body['errors'])
+
+
+def test_invalid_update_returns_field_errors(client):
+    client.post(URL, json=item_payload())
+
+    response = client.patch(f'{URL}M9000', json={'priority': 'urgent'})
+    assert response.status_code == 400
+    assert 'priority' in response.get_json()['errors']
+
+
+@pytest.mark.parametrize('body', [
+    {},
+    {'data': 'not json', 'content_type': 'application/json'},
+    {'data': 'id=M1', 'content_type': 'text/plain'},
+    {'json': ['not', 'an', 'object']},
+])
+def test_missing_or_malformed_body_is_a_validation_error(client, body):
+    response = client.post(URL, **body)
+    assert response.status_code == 400
+    assert response.get_json() == {
+        'message': 'Validation error',
+        'errors': {'_schema': ['Invalid input type.']}
+    }